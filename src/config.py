@@ -276,7 +276,7 @@ class OutputConfig:
 @dataclass
 class MatchingConfig:
     """Settings for fuzzy matching retailer names / contacts."""
-    fuzzy_threshold: int = 82              # 0-100, fuzzywuzzy ratio score
+    fuzzy_threshold: int = 82              # 0-100, fuzz.ratio-style score (rapidfuzz)
     exact_match_fields: list[str] = field(default_factory=lambda: [
         "license_number",
         "invoice_number",
@@ -27,18 +27,43 @@ CC rules (always):
     - laura@piccplatform.com
     - Dynamic: assigned PICC sales rep email for the account
 
-Uses difflib.SequenceMatcher for fuzzy matching (no external dependencies).
+Fuzzy scores come from difflib.SequenceMatcher. When rapidfuzz is installed
+its Indel similarity, which never scores a pair lower, is used only to skip
+candidates that cannot win, so matches are the same either way (no required
+dependencies).
 """
 
 from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass, field
+import sys
+from collections import Counter
+from dataclasses import dataclass, field, replace
 from difflib import SequenceMatcher
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz.distance import Indel
+    from rapidfuzz.process import cdist, extract
+    _HAS_RAPIDFUZZ = True
+except ImportError:
+    _HAS_RAPIDFUZZ = False
+    fuzz = None
+    Indel = None
+    cdist = None
+    extract = None
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,10 +81,13 @@ SOURCE_TRUST: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=128)
 def _get_source_trust(source: str) -> str:
     """Return trust level for a contact source label.
 
     Returns 'high', 'low', or 'medium' (default for unknown sources).
+    Memoized: the set of source labels in a directory is tiny, but this
+    runs for every associated contact during TO-list assembly.
     """
     if not source:
         return "medium"
@@ -80,13 +108,20 @@ REP_EMAIL_MAP: dict[str, str] = {
     "Matt M": "matt@piccplatform.com",
 }
 
-# Hardcoded base CC list per meeting SOP
-ALWAYS_CC: list[str] = [
+# Hardcoded base CC list per meeting SOP (immutable; copied per email)
+ALWAYS_CC: tuple[str, ...] = (
     "ny.ar@nabis.com",
     "martinm@piccplatform.com",
     "mario@piccplatform.com",
     "laura@piccplatform.com",
-]
+)
+
+# Billing/AP detection: contact name/title keywords, and mailbox prefixes
+# anywhere in the address (e.g. "ap@", "billing@"). Substring semantics.
+_BILLING_KEYWORD_RE = re.compile(
+    r"ap|accounts payable|billing|accounting|finance|invoic"
+)
+_BILLING_EMAIL_RE = re.compile(r"(?:ap|accounting|invoices|billing)@", re.IGNORECASE)
 
 # Placeholder for no-contact-found emails
 NO_CONTACT_PLACEHOLDER = "(no contact found - enter manually)"
@@ -110,6 +145,16 @@ CONFIDENCE_EXACT_LICENSE_ONLY: float = 0.80
 CONFIDENCE_FUZZY_NAME_ONLY: float = 0.60
 CONFIDENCE_NO_MATCH: float = 0.00
 
+# ResolutionReport.confidence_distribution buckets as (floor, label),
+# highest first; a confidence lands in the first bucket it reaches.
+_CONFIDENCE_BUCKETS: tuple[tuple[float, str], ...] = (
+    (1.0, "100%"),
+    (0.9, "90%"),
+    (0.8, "80%"),
+    (0.6, "60%"),
+    (float("-inf"), "0% (unmatched)"),
+)
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -124,7 +169,7 @@ class MatchTier(Enum):
     NO_MATCH = "no_match"
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching a single invoice (or invoice group) to a contact.
 
@@ -134,7 +179,8 @@ class MatchResult:
         contact: The resolved Contact object, or None if unmatched.
         confidence: Float 0.0-1.0 representing match confidence.
         match_tier: Which tier of the matching strategy produced this result.
-        fuzzy_score: The SequenceMatcher ratio if fuzzy matching was used.
+        fuzzy_score: The two-pass SequenceMatcher similarity (see
+            _compute_similarity) if fuzzy matching was used.
         matched_contact_name: The retailer name from the Managers sheet that
             was matched (may differ slightly from invoice location).
         notes: Human-readable notes about the match for audit/review.
@@ -209,12 +255,26 @@ class ResolutionReport:
 # ---------------------------------------------------------------------------
 # Name normalization helpers
 # ---------------------------------------------------------------------------
-
+# Both normalizers are memoized: the same store names (invoice locations and
+# contact retailer names) are normalized over and over during a batch. The
+# cache is sized to hold a full contacts directory plus a month of invoice
+# locations, so real-data runs never evict. Results are interned so equal
+# normalized names share one object across contacts and invoices.
+_NORMALIZE_CACHE_SIZE = 16384
+
+_RE_WS = re.compile(r"\s+")
+_RE_PARENS = re.compile(r"\s*\(([^)]+)\)\s*")
+_RE_SEPARATOR = re.compile(r"\s*[-/]\s*")
+_RE_PUNCT = re.compile(r"[^\w\s]")
+_RE_ARTICLE = re.compile(r"^the\s+")
+_RE_SUFFIX = re.compile(r"\s+(inc|llc|ltd|corp|dispensary|cannabis|club)\s*$")
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_name(name: str) -> str:
     """Normalize a store name for comparison.
 
     Applies the following transformations:
-    - Lowercase
+    - Casefold (Unicode-aware lowercase)
     - Strip leading/trailing whitespace
     - Remove trailing punctuation (periods, commas)
     - Collapse multiple spaces into one
@@ -230,14 +290,17 @@ def _normalize_name(name: str) -> str:
     """
     if not name:
         return ""
-    result = name.strip().lower()
-    # Remove trailing punctuation
-    result = result.rstrip(".,;:")
-    # Collapse multiple whitespace
-    result = re.sub(r"\s+", " ", result)
-    return result
+    result = name.strip().casefold().rstrip(".,;:")
+    # Collapse whitespace runs. Most names are already clean (single ASCII
+    # spaces), so only fall back to the regex when a double space or any
+    # other whitespace character (tab, newline, NBSP -- all non-printable)
+    # is present.
+    if "  " in result or not result.isprintable():
+        result = _RE_WS.sub(" ", result)
+    return sys.intern(result)
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_for_fuzzy(name: str) -> str:
     """Aggressive normalization for fuzzy comparison.
 
@@ -257,21 +320,154 @@ def _normalize_for_fuzzy(name: str) -> str:
     """
     if not name:
         return ""
-    result = name.strip().lower()
+    result = name.strip().casefold()
     # Replace parenthesized content with hyphen-separated equivalent
     # "(SoHo)" -> "- SoHo" before further processing
-    result = re.sub(r"\s*\(([^)]+)\)\s*", r" \1 ", result)
+    result = _RE_PARENS.sub(r" \1 ", result)
     # Remove hyphens and extra separators, replace with spaces
-    result = re.sub(r"\s*[-/]\s*", " ", result)
+    result = _RE_SEPARATOR.sub(" ", result)
     # Remove all remaining punctuation except alphanumeric and spaces
-    result = re.sub(r"[^\w\s]", "", result)
+    result = _RE_PUNCT.sub("", result)
     # Remove common articles from start
-    result = re.sub(r"^the\s+", "", result)
+    result = _RE_ARTICLE.sub("", result)
     # Remove common suffixes that don't help matching
-    result = re.sub(r"\s+(inc|llc|ltd|corp|dispensary|cannabis|club)\s*$", "", result)
-    # Collapse whitespace
-    result = re.sub(r"\s+", " ", result).strip()
-    return result
+    result = _RE_SUFFIX.sub("", result)
+    # Collapse whitespace (split() also drops leading/trailing runs)
+    result = " ".join(result.split())
+    return sys.intern(result)
+
+
+def _ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """Similarity of two already-normalized strings in [0.0, 1.0].
+
+    Always difflib.SequenceMatcher, so scores do not depend on which
+    optional packages are installed. rapidfuzz's Indel similarity scores
+    the longest common subsequence, and SequenceMatcher's matching blocks
+    are one such subsequence, so Indel is an upper bound on this ratio and
+    is only used to prune candidates (see _extract_best).
+
+    Scores below ``score_cutoff`` come back as 0.0 and are cheaper: difflib
+    bails out on its upper bounds (real_quick_ratio, quick_ratio) before
+    the full ratio().
+    """
+    matcher = SequenceMatcher(None, a, b)
+    if score_cutoff > 0.0 and (
+        matcher.real_quick_ratio() < score_cutoff
+        or matcher.quick_ratio() < score_cutoff
+    ):
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= score_cutoff else 0.0
+
+
+def _length_ratio_bound(len_a: int, len_b: int) -> float:
+    """Upper bound on _ratio() for strings of the given lengths."""
+    total = len_a + len_b
+    if not total:
+        return 1.0
+    return 2.0 * min(len_a, len_b) / total
+
+
+# Upper bounds and exact scores are computed by different code and can
+# round differently. Leave a little slack so an exact tie is never pruned;
+# distinct scores for store-name lengths are much further apart than this.
+_CUTOFF_SLACK = 1e-6
+
+
+def _pair_similarity(
+    norm_a: str,
+    fuzzy_a: str,
+    norm_b: str,
+    fuzzy_b: str,
+    score_cutoff: float = 0.0,
+) -> float:
+    """_compute_similarity() for names already run through both normalizers.
+
+    Scores below ``score_cutoff`` may be returned as 0.0 (see _ratio).
+    """
+    if norm_a == norm_b or fuzzy_a == fuzzy_b:
+        return 1.0
+    if fuzzy_a == norm_a and fuzzy_b == norm_b:
+        return _ratio(norm_a, norm_b, score_cutoff)
+    return max(
+        _ratio(norm_a, norm_b, score_cutoff),
+        _ratio(fuzzy_a, fuzzy_b, score_cutoff),
+    )
+
+
+def _best_candidate(
+    norm_a: str,
+    fuzzy_a: str,
+    norm_choices: list[str],
+    fuzzy_choices: list[str],
+    bounds,
+    score_cutoff: float = 0.0,
+) -> tuple[float, int]:
+    """Best _pair_similarity() over parallel candidate lists.
+
+    ``bounds`` yields (candidate_index, upper_bound) pairs, highest bound
+    first. Ties go to the earliest candidate.
+
+    Returns:
+        (best_score, candidate_index); (-1.0, -1) if ``bounds`` is empty.
+    """
+    best_score = -1.0
+    best_idx = -1
+    for idx, bound in bounds:
+        floor = max(best_score, score_cutoff)
+        # Bounds come sorted, so once one falls below the current best, no
+        # later candidate can beat or tie it. (Slack: a candidate sitting
+        # exactly on its bound may still win a tie.)
+        if bound < floor - _CUTOFF_SLACK:
+            break
+        # Only a score that reaches the current best matters, so let the
+        # scorer give up early on anything below it (with slack so exact
+        # ties are still scored in full).
+        cutoff = floor - _CUTOFF_SLACK if floor > 0.0 else 0.0
+        candidate_score = _pair_similarity(
+            norm_a, fuzzy_a, norm_choices[idx], fuzzy_choices[idx], cutoff,
+        )
+        if candidate_score > best_score or (
+            candidate_score == best_score and idx < best_idx
+        ):
+            best_score = candidate_score
+            best_idx = idx
+    return best_score, best_idx
+
+
+def _extract_best(
+    norm_a: str,
+    fuzzy_a: str,
+    norm_choices: list[str],
+    fuzzy_choices: list[str],
+    score_cutoff: float = 0.0,
+) -> tuple[float, int] | None:
+    """Best two-pass similarity over parallel candidate lists via rapidfuzz.
+
+    Equivalent to taking max(_compute_similarity(...)) over the candidates,
+    with ties going to the earliest one. rapidfuzz's Indel scores only rank
+    the candidates and rule out those below ``score_cutoff``; the survivors
+    are scored with _ratio() until their bound drops below the best.
+
+    Returns:
+        (score, index) of the best candidate, or None if there are no
+        candidates or the best scores below ``score_cutoff``.
+    """
+    bounds: dict[int, float] = {}
+    for query, choices in ((norm_a, norm_choices), (fuzzy_a, fuzzy_choices)):
+        for _name, bound, idx in extract(
+            query, choices, scorer=Indel.normalized_similarity, limit=None,
+            score_cutoff=max(0.0, score_cutoff - _CUTOFF_SLACK),
+        ):
+            if bound > bounds.get(idx, -1.0):
+                bounds[idx] = bound
+    ranked = sorted(bounds.items(), key=lambda pair: -pair[1])
+    score, idx = _best_candidate(
+        norm_a, fuzzy_a, norm_choices, fuzzy_choices, ranked, score_cutoff,
+    )
+    if idx < 0 or score < score_cutoff:
+        return None
+    return score, idx
 
 
 def _compute_similarity(name_a: str, name_b: str) -> float:
@@ -289,19 +485,32 @@ def _compute_similarity(name_a: str, name_b: str) -> float:
     Returns:
         Float between 0.0 and 1.0 representing similarity.
     """
+    # Fast path: identical raw strings (e.g. grouped invoices sharing a
+    # location) need no normalization at all. ``==`` checks identity first.
+    if name_a == name_b:
+        return 1.0
+
     # Pass 1: basic normalization
     norm_a = _normalize_name(name_a)
     norm_b = _normalize_name(name_b)
     if norm_a == norm_b:
         return 1.0
-    basic_ratio = SequenceMatcher(None, norm_a, norm_b).ratio()
+    if not norm_a or not norm_b:
+        # Exactly one side is empty after normalization; pass 1 scores 0.0
+        # without running the scorer.
+        basic_ratio = 0.0
+    else:
+        basic_ratio = _ratio(norm_a, norm_b)
 
     # Pass 2: aggressive normalization
     fuzzy_a = _normalize_for_fuzzy(name_a)
     fuzzy_b = _normalize_for_fuzzy(name_b)
     if fuzzy_a == fuzzy_b:
         return 1.0
-    fuzzy_ratio = SequenceMatcher(None, fuzzy_a, fuzzy_b).ratio()
+    if fuzzy_a == norm_a and fuzzy_b == norm_b:
+        # Aggressive normalization changed nothing; pass 2 would repeat pass 1
+        return basic_ratio
+    fuzzy_ratio = _ratio(fuzzy_a, fuzzy_b)
 
     return max(basic_ratio, fuzzy_ratio)
 
@@ -463,6 +672,16 @@ class ContactResolver:
         self._license_index = _build_license_index(contacts)
         self._name_index = _build_name_index(contacts)
 
+        # (license, normalized name) -> first contact, for O(1) Tier 1
+        self._license_name_index: dict[tuple[str, str], object] = {}
+        for license_key, license_contacts in self._license_index.items():
+            for contact in license_contacts:
+                key = (
+                    license_key,
+                    _normalize_name(str(getattr(contact, "retailer_name", ""))),
+                )
+                self._license_name_index.setdefault(key, contact)
+
         # Pre-compute all normalized names for fuzzy scanning
         self._name_candidates: list[tuple[str, str, list]] = []
         for contact in contacts:
@@ -473,13 +692,28 @@ class ContactResolver:
                 # Group by normalized name
                 self._name_candidates.append((raw, norm, [contact]))
 
+        self._precompute_normalized()
+
+        # Best fuzzy candidate per raw location, filled in bulk by resolve()
+        self._fuzzy_best_cache: dict[str, tuple[float, int]] = {}
+
         # Pre-compute Brand AR Summary name candidates for fuzzy matching
+        # and a normalized-name index (in insertion order) for exact lookup
         self._brand_ar_name_candidates: list[tuple[str, str, object]] = []
+        self._brand_ar_index: dict[str, list] = {}
         for raw_name, ar_contact in self._brand_ar_contacts.items():
             norm = _normalize_name(raw_name)
             self._brand_ar_name_candidates.append(
                 (raw_name, norm, ar_contact)
             )
+            self._brand_ar_index.setdefault(norm, []).append(ar_contact)
+        self._brand_ar_norm_basic: list[str] = [
+            norm for _raw, norm, _contact in self._brand_ar_name_candidates
+        ]
+        self._brand_ar_norm_fuzzy: list[str] = [
+            _normalize_for_fuzzy(raw)
+            for raw, _norm, _contact in self._brand_ar_name_candidates
+        ]
 
         logger.info(
             "ContactResolver initialized: %d contacts, %d license keys, "
@@ -490,6 +724,102 @@ class ContactResolver:
             len(self._brand_ar_contacts),
         )
 
+    # -------------------------------------------------------------------
+    # Fuzzy candidate scoring
+    # -------------------------------------------------------------------
+
+    def _precompute_normalized(self) -> None:
+        """Cache both normalizations of every name candidate, by position."""
+        self._norm_basic: list[str] = [
+            norm for _raw, norm, _contacts in self._name_candidates
+        ]
+        self._norm_fuzzy: list[str] = [
+            _normalize_for_fuzzy(raw) for raw, _norm, _contacts in self._name_candidates
+        ]
+        # Candidates bucketed by (basic, fuzzy) length; every member of a
+        # bucket shares one length bound, so scans rank buckets instead of
+        # candidates. Indices stay ascending within a bucket.
+        self._len_buckets: dict[tuple[int, int], list[int]] = {}
+        for idx, (basic, fuzzy) in enumerate(zip(self._norm_basic, self._norm_fuzzy)):
+            self._len_buckets.setdefault((len(basic), len(fuzzy)), []).append(idx)
+
+    def _candidate_bounds(self, len_a: int, fuzzy_len_a: int):
+        """Yield (candidate_index, length_bound) pairs for a fuzzy scan.
+
+        Length buckets are ranked highest-bound first (stable, so equal
+        bounds keep index order); callers may stop at the first bound below
+        their best score.
+        """
+        ranked = sorted(
+            (
+                (max(
+                    _length_ratio_bound(len_a, len_b),
+                    _length_ratio_bound(fuzzy_len_a, fuzzy_len_b),
+                ), members)
+                for (len_b, fuzzy_len_b), members in self._len_buckets.items()
+            ),
+            key=lambda pair: -pair[0],
+        )
+        return (
+            (idx, bound) for bound, members in ranked for idx in members
+        )
+
+    def _score_locations(self, locations: list[str]) -> list[tuple[float, int]]:
+        """Find the best name candidate for each location.
+
+        Scores match _compute_similarity() against every entry in
+        _name_candidates. Ties go to the earliest candidate.
+
+        Returns:
+            One (best_score, candidate_index) pair per location; the index
+            is -1 when there are no candidates.
+        """
+        if not self._name_candidates:
+            return [(0.0, -1) for _ in locations]
+
+        basic = [_normalize_name(loc) for loc in locations]
+        fuzzy = [_normalize_for_fuzzy(loc) for loc in locations]
+
+        if _HAS_RAPIDFUZZ and _HAS_NUMPY:
+            # One C++ pass over the whole locations x candidates grid per
+            # normalization gives every pair's Indel score, an upper bound
+            # on _ratio(), as 0-100 uint8 (a quarter of float32's memory
+            # traffic). Each row is then scored exactly, best bound first;
+            # the extra point covers the rounding to uint8.
+            workers = -1 if len(locations) > 1 else 1
+            quantized = np.maximum(
+                cdist(basic, self._norm_basic, scorer=fuzz.ratio,
+                      dtype=np.uint8, workers=workers),
+                cdist(fuzzy, self._norm_fuzzy, scorer=fuzz.ratio,
+                      dtype=np.uint8, workers=workers),
+            )
+
+            def row_bounds(row):
+                order = np.argsort(255 - row, kind="stable")
+                return zip(order.tolist(), ((row[order] + 1.0) / 100.0).tolist())
+
+            bounds = (row_bounds(row) for row in quantized)
+        else:
+            bounds = (
+                self._candidate_bounds(len(norm_a), len(fuzzy_a))
+                for norm_a, fuzzy_a in zip(basic, fuzzy)
+            )
+
+        return [
+            _best_candidate(
+                norm_a, fuzzy_a, self._norm_basic, self._norm_fuzzy, row,
+            )
+            for norm_a, fuzzy_a, row in zip(basic, fuzzy, bounds)
+        ]
+
+    def _best_name_candidate(self, location: str) -> tuple[float, int]:
+        """Best (score, candidate_index) for one location, using the cache."""
+        cached = self._fuzzy_best_cache.get(location)
+        if cached is None:
+            cached = self._score_locations([location])[0]
+            self._fuzzy_best_cache[location] = cached
+        return cached
+
     # -------------------------------------------------------------------
     # Single-invoice matching
     # -------------------------------------------------------------------
@@ -537,30 +867,29 @@ class ContactResolver:
         # ---------------------------------------------------------------
         # Tier 1: Exact License + Exact Name (100% confidence)
         # ---------------------------------------------------------------
-        if license_key and license_key in self._license_index:
-            license_contacts = self._license_index[license_key]
-            for contact in license_contacts:
-                contact_name = _normalize_name(
-                    str(getattr(contact, "retailer_name", ""))
+        license_contacts = (
+            self._license_index.get(license_key) if license_key else None
+        )
+        if license_contacts:
+            contact = self._license_name_index.get((license_key, name_key))
+            if contact is not None:
+                primary = _select_primary_contact([contact])
+                result.contact = primary
+                result.confidence = CONFIDENCE_EXACT_LICENSE_EXACT_NAME
+                result.match_tier = MatchTier.EXACT_LICENSE_EXACT_NAME
+                result.fuzzy_score = 1.0
+                result.matched_contact_name = str(
+                    getattr(contact, "retailer_name", "")
                 )
-                if contact_name == name_key:
-                    primary = _select_primary_contact([contact])
-                    result.contact = primary
-                    result.confidence = CONFIDENCE_EXACT_LICENSE_EXACT_NAME
-                    result.match_tier = MatchTier.EXACT_LICENSE_EXACT_NAME
-                    result.fuzzy_score = 1.0
-                    result.matched_contact_name = str(
-                        getattr(contact, "retailer_name", "")
-                    )
-                    result.notes = (
-                        f"Exact match on license '{license_num}' "
-                        f"and store name '{location}'"
-                    )
-                    logger.debug(
-                        "Invoice %s: Tier 1 match (license+name) -> %s",
-                        order_no, result.matched_contact_name,
-                    )
-                    return result
+                result.notes = (
+                    f"Exact match on license '{license_num}' "
+                    f"and store name '{location}'"
+                )
+                logger.debug(
+                    "Invoice %s: Tier 1 match (license+name) -> %s",
+                    order_no, result.matched_contact_name,
+                )
+                return result
 
             # ---------------------------------------------------------------
             # Tier 2: Exact License + Fuzzy Name (90% confidence)
@@ -624,9 +953,10 @@ class ContactResolver:
         # Tier 4: Fuzzy Name only (60% confidence)
         # ---------------------------------------------------------------
         if name_key:
-            # First try exact name match in the name index
-            if name_key in self._name_index:
-                name_contacts = self._name_index[name_key]
+            # First try exact name match in the name index; a hit skips
+            # the fuzzy scan entirely.
+            name_contacts = self._name_index.get(name_key)
+            if name_contacts:
                 primary = _select_primary_contact(name_contacts)
                 if primary:
                     result.contact = primary
@@ -657,15 +987,11 @@ class ContactResolver:
                     return result
 
             # Fuzzy scan all contact names
-            best_score = 0.0
+            best_score, best_idx = self._best_name_candidate(location)
             best_contacts: list = []
             best_name = ""
-            for raw_name, _norm, contact_list in self._name_candidates:
-                score = _compute_similarity(location, raw_name)
-                if score > best_score:
-                    best_score = score
-                    best_contacts = contact_list
-                    best_name = raw_name
+            if best_idx >= 0:
+                best_name, _norm, best_contacts = self._name_candidates[best_idx]
 
             if best_score >= self.fuzzy_threshold and best_contacts:
                 primary = _select_primary_contact(best_contacts)
@@ -700,12 +1026,10 @@ class ContactResolver:
         best_hint = ""
         if name_key:
             # Provide the closest near-miss for manual review
-            hint_score = 0.0
-            for raw_name, _norm, _contacts in self._name_candidates:
-                score = _compute_similarity(location, raw_name)
-                if score > hint_score:
-                    hint_score = score
-                    best_hint = f" (closest: '{raw_name}' at {score:.3f})"
+            hint_score, hint_idx = self._best_name_candidate(location)
+            if hint_score > 0.0:
+                raw_name = self._name_candidates[hint_idx][0]
+                best_hint = f" (closest: '{raw_name}' at {hint_score:.3f})"
 
         result.notes = (
             f"No match found for '{location}'"
@@ -743,9 +1067,11 @@ class ContactResolver:
         Returns:
             The same MatchResult, updated with to_emails and resolution_chain.
         """
+        contact = match_result.contact
+
         chain: list[str] = []
         to_emails: list[str] = []
-        contact = match_result.contact
+        to_seen: set[str] = set()  # lowercased to_emails, for O(1) dedup
 
         # ------------------------------------------------------------------
         # Priority 1 & 2: Primary + Billing from matched contact
@@ -761,13 +1087,15 @@ class ContactResolver:
             # Add primary email
             if primary_email:
                 to_emails.append(primary_email)
+                to_seen.add(primary_email.lower())
                 chain.append(f"  -> Primary email: {primary_email}")
 
             # Check for billing/AP contacts in all_contacts
             billing_emails = self._find_billing_contacts(all_contacts, all_emails)
             for be in billing_emails:
-                if be and be.lower() not in [e.lower() for e in to_emails]:
+                if be and be.lower() not in to_seen:
                     to_emails.append(be)
+                    to_seen.add(be.lower())
                     chain.append(f"  -> Billing/AP email: {be}")
 
             # Priority 3: Associated Contacts (with source trust filtering)
@@ -777,15 +1105,17 @@ class ContactResolver:
 
                 # Prefer high-trust sources first
                 for email in trusted:
-                    if email.lower() not in [e.lower() for e in to_emails]:
+                    if email.lower() not in to_seen:
                         to_emails.append(email)
+                        to_seen.add(email.lower())
                         chain.append(f"  -> Trusted associated contact: {email}")
 
                 # Fall back to low-trust (Revelry) only if nothing else
                 if not to_emails and untrusted:
                     for email in untrusted:
-                        if email.lower() not in [e.lower() for e in to_emails]:
+                        if email.lower() not in to_seen:
                             to_emails.append(email)
+                            to_seen.add(email.lower())
                             chain.append(
                                 f"  -> Revelry-sourced contact (low trust): {email}"
                             )
@@ -844,28 +1174,21 @@ class ContactResolver:
         Returns:
             De-duplicated list of CC email addresses.
         """
-        cc: list[str] = list(ALWAYS_CC)
-
-        # Add the assigned sales rep email
+        # Base CCs, then the assigned sales rep, then any extra CCs
+        candidates: list[str] = list(ALWAYS_CC)
         sales_rep = str(getattr(invoice, "sales_rep", "") or "").strip()
         if sales_rep:
-            rep_email = self._rep_email_map.get(sales_rep, "")
-            if rep_email and rep_email.lower() not in [c.lower() for c in cc]:
-                cc.append(rep_email)
-
-        # Add any extra CCs
+            candidates.append(self._rep_email_map.get(sales_rep, ""))
         if extra_cc:
-            for addr in extra_cc:
-                if addr and addr.lower() not in [c.lower() for c in cc]:
-                    cc.append(addr)
-
-        # Remove any placeholder tokens
-        cc = [addr for addr in cc if addr and "{" not in addr]
+            candidates.extend(extra_cc)
 
-        # De-duplicate while preserving order
+        # Drop blanks and placeholder tokens, de-duplicate case-insensitively
+        # while preserving order (one set probe per address).
         seen: set[str] = set()
         deduped: list[str] = []
-        for addr in cc:
+        for addr in candidates:
+            if not addr or "{" in addr:
+                continue
             addr_lower = addr.strip().lower()
             if addr_lower not in seen:
                 seen.add(addr_lower)
@@ -887,31 +1210,22 @@ class ContactResolver:
         Returns emails of contacts whose title indicates billing/AP role.
         """
         billing_emails: list[str] = []
-        billing_keywords = ["ap", "accounts payable", "billing", "accounting",
-                            "finance", "invoic"]
 
         for contact_dict in all_contacts:
             title = (contact_dict.get("title") or "").lower()
             name = (contact_dict.get("name") or contact_dict.get("full_name") or "").lower()
-            combined = f"{name} {title}"
 
-            for kw in billing_keywords:
-                if kw in combined:
-                    # Try to find an email for this contact
-                    email = contact_dict.get("email", "")
-                    if email:
-                        billing_emails.append(email)
-                    break
+            if _BILLING_KEYWORD_RE.search(f"{name} {title}"):
+                # Try to find an email for this contact
+                email = contact_dict.get("email", "")
+                if email:
+                    billing_emails.append(email)
 
         # Also check all_emails for AP/billing-pattern emails
-        for email in all_emails:
-            email_lower = email.lower()
-            if any(prefix in email_lower for prefix in
-                   ["ap@", "accounting@", "invoices@", "billing@"]):
-                if email not in billing_emails:
-                    billing_emails.append(email)
+        billing_emails.extend(e for e in all_emails if _BILLING_EMAIL_RE.search(e))
 
-        return billing_emails
+        # Order-preserving dedup in one hashed pass
+        return list(dict.fromkeys(billing_emails))
 
     @staticmethod
     def _filter_contacts_by_source(
@@ -962,24 +1276,33 @@ class ContactResolver:
         name_key = _normalize_name(location)
 
         # Exact match first
-        for raw_name, norm, ar_contact in self._brand_ar_name_candidates:
-            if norm == name_key:
-                emails = getattr(ar_contact, "poc_emails", []) or []
-                if emails:
-                    logger.info(
-                        "Brand AR Summary exact match: '%s' -> %s",
-                        location, emails,
-                    )
-                    return emails
+        for ar_contact in self._brand_ar_index.get(name_key, ()):
+            emails = getattr(ar_contact, "poc_emails", []) or []
+            if emails:
+                logger.info(
+                    "Brand AR Summary exact match: '%s' -> %s",
+                    location, emails,
+                )
+                return emails
 
         # Fuzzy match
         best_score = 0.0
         best_contact = None
-        for raw_name, _norm, ar_contact in self._brand_ar_name_candidates:
-            score = _compute_similarity(location, raw_name)
-            if score > best_score:
-                best_score = score
-                best_contact = ar_contact
+        if _HAS_RAPIDFUZZ:
+            best = _extract_best(
+                name_key, _normalize_for_fuzzy(location),
+                self._brand_ar_norm_basic, self._brand_ar_norm_fuzzy,
+                score_cutoff=self.fuzzy_threshold,
+            )
+            if best is not None and best[0] > 0.0:
+                best_score, best_idx = best
+                best_contact = self._brand_ar_name_candidates[best_idx][2]
+        else:
+            for raw_name, _norm, ar_contact in self._brand_ar_name_candidates:
+                score = _compute_similarity(location, raw_name)
+                if score > best_score:
+                    best_score = score
+                    best_contact = ar_contact
 
         if best_score >= self.fuzzy_threshold and best_contact is not None:
             emails = getattr(best_contact, "poc_emails", []) or []
@@ -1014,53 +1337,70 @@ class ContactResolver:
         Returns:
             A ResolutionReport with matched/unmatched lists and statistics.
         """
-        report = ResolutionReport(total_invoices=len(invoices))
+        self._prefetch_fuzzy_scores(invoices)
 
         if group_by_location:
             results = self._resolve_grouped(invoices)
         else:
-            results = [self.match_invoice(inv) for inv in invoices]
+            results = self._match_each(invoices)
 
         # Apply the SOP priority chain to resolve TO recipients
+        resolve_to_recipients = self.resolve_to_recipients
         for result in results:
-            self.resolve_to_recipients(result)
+            resolve_to_recipients(result)
+
+        return self._build_report(len(invoices), results)
 
-        # Partition results
+    def _prefetch_fuzzy_scores(self, invoices: list) -> None:
+        """Batch-score every not-yet-seen location against all candidates.
+
+        Fills _fuzzy_best_cache so match_invoice() only does cache lookups.
+        Locations with an exact name-index hit never reach the fuzzy scan
+        and are skipped.
+        """
+        pending = list(dict.fromkeys(
+            loc for loc in (
+                str(getattr(inv, "location", "") or "").strip()
+                for inv in invoices
+            )
+            if loc
+            and loc not in self._fuzzy_best_cache
+            and _normalize_name(loc) not in self._name_index
+        ))
+        if pending:
+            self._fuzzy_best_cache.update(
+                zip(pending, self._score_locations(pending))
+            )
+
+    def _build_report(
+        self,
+        total_invoices: int,
+        results: list[MatchResult],
+    ) -> ResolutionReport:
+        """Partition resolved results and compute report statistics."""
+        report = ResolutionReport(total_invoices=total_invoices)
+
+        # Partition results and tally invoices per confidence bucket in one
+        # pass (grouped results count once per invoice they cover)
+        buckets: Counter[str] = Counter()
+        total_matched_invoices = 0
         for result in results:
+            count = len(result.invoice_order_nos)
             if result.match_tier == MatchTier.NO_MATCH:
                 report.unmatched.append(result)
             else:
                 report.matched.append(result)
+                total_matched_invoices += count
+            buckets[_confidence_bucket(result.confidence)] += count
 
         # Compute statistics
         if report.total_invoices > 0:
-            # Count total matched invoices (accounting for grouped results)
-            total_matched_invoices = sum(
-                len(m.invoice_order_nos) for m in report.matched
-            )
             report.match_rate = total_matched_invoices / report.total_invoices
 
-        # Build confidence distribution
-        confidence_buckets = {
-            "100%": 0,
-            "90%": 0,
-            "80%": 0,
-            "60%": 0,
-            "0% (unmatched)": 0,
+        # Build confidence distribution (every bucket present, fixed order)
+        report.confidence_distribution = {
+            label: buckets[label] for _floor, label in _CONFIDENCE_BUCKETS
         }
-        for result in report.matched + report.unmatched:
-            count = len(result.invoice_order_nos)
-            if result.confidence >= 1.0:
-                confidence_buckets["100%"] += count
-            elif result.confidence >= 0.9:
-                confidence_buckets["90%"] += count
-            elif result.confidence >= 0.8:
-                confidence_buckets["80%"] += count
-            elif result.confidence >= 0.6:
-                confidence_buckets["60%"] += count
-            else:
-                confidence_buckets["0% (unmatched)"] += count
-        report.confidence_distribution = confidence_buckets
 
         # Log summary
         logger.info(
@@ -1082,6 +1422,35 @@ class ContactResolver:
 
         return report
 
+    def _match_each(self, invoices: list) -> list[MatchResult]:
+        """Match invoices one result per invoice, matching each distinct
+        (location, license) pair only once.
+
+        Later invoices for an already-seen pair get a copy of the first
+        result with their own order number and fresh list fields.
+        """
+        results: list[MatchResult] = []
+        seen: dict[tuple[str, str], MatchResult] = {}
+        match_invoice = self.match_invoice
+        for invoice in invoices:
+            key = (
+                str(getattr(invoice, "location", "") or "").strip(),
+                str(getattr(invoice, "license_number", "") or "").strip(),
+            )
+            template = seen.get(key)
+            if template is None:
+                result = seen[key] = match_invoice(invoice)
+            else:
+                result = replace(
+                    template,
+                    invoice_order_nos=[getattr(invoice, "order_no", 0)],
+                    resolution_chain=list(template.resolution_chain),
+                    to_emails=list(template.to_emails),
+                    cc_emails=list(template.cc_emails),
+                )
+            results.append(result)
+        return results
+
     def _resolve_grouped(self, invoices: list) -> list[MatchResult]:
         """Group invoices by location and resolve each group once.
 
@@ -1095,30 +1464,21 @@ class ContactResolver:
         Returns:
             List of MatchResult objects, one per unique location.
         """
-        # Group invoices by normalized location
-        groups: dict[str, list] = {}
-        location_raw: dict[str, str] = {}  # normalized -> first raw value
-
-        for invoice in invoices:
-            loc = str(getattr(invoice, "location", "") or "").strip()
-            key = _normalize_name(loc)
-            if key not in groups:
-                groups[key] = []
-                location_raw[key] = loc
-            groups[key].append(invoice)
-
         results: list[MatchResult] = []
-        for key, group in groups.items():
+        match_invoice = self.match_invoice
+        for group in _group_invoices_by_location(invoices).values():
             # Use the first invoice in the group as the representative
             representative = group[0]
-            result = self.match_invoice(representative)
+            result = match_invoice(representative)
 
             # Replace the single order number with all order numbers
             result.invoice_order_nos = [
                 getattr(inv, "order_no", 0) for inv in group
             ]
             # Use the raw location from the first invoice
-            result.invoice_location = location_raw[key]
+            result.invoice_location = str(
+                getattr(representative, "location", "") or ""
+            ).strip()
 
             if len(group) > 1:
                 result.notes += (
@@ -1131,6 +1491,31 @@ class ContactResolver:
         return results
 
 
+# ---------------------------------------------------------------------------
+# Batch helpers
+# ---------------------------------------------------------------------------
+
+def _confidence_bucket(confidence: float) -> str:
+    """Label of the confidence_distribution bucket for a match confidence."""
+    for floor, label in _CONFIDENCE_BUCKETS:
+        if confidence >= floor:
+            return label
+    return _CONFIDENCE_BUCKETS[-1][1]  # NaN
+
+
+def _group_invoices_by_location(invoices: list) -> dict[str, list]:
+    """Bucket invoices by normalized location, in first-seen order."""
+    groups: dict[str, list] = {}
+    normalize = _normalize_name
+    for invoice in invoices:
+        key = normalize(str(getattr(invoice, "location", "") or "").strip())
+        group = groups.get(key)
+        if group is None:
+            groups[key] = group = []
+        group.append(invoice)
+    return groups
+
+
 # ---------------------------------------------------------------------------
 # Convenience functions
 # ---------------------------------------------------------------------------
@@ -9,6 +9,9 @@ Supported data sources
 * **Bytes buffer** -- ``io.BytesIO`` for future Google Sheets API or
   HTTP-download pipelines.
 
+Workbooks are read with ``python-calamine`` (Rust reader) when it is
+installed, otherwise with openpyxl in read-only mode.
+
 Sheet layout (see ``agent-outputs/04-xlsx-schema-analysis.md``):
 
 +-----------------------+---------------------------------------------------+
@@ -33,9 +36,14 @@ Usage::
 
 from __future__ import annotations
 
+import copy
 import io
 import logging
+import os
 import re
+import sys
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
@@ -45,6 +53,13 @@ import openpyxl
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
+try:
+    from python_calamine import CalamineWorkbook
+    _HAS_CALAMINE = True
+except ImportError:  # optional accelerator; openpyxl handles everything
+    CalamineWorkbook = None
+    _HAS_CALAMINE = False
+
 from .models import Contact, Invoice, InvoiceStatus, SkipReason, Tier
 
 logger = logging.getLogger(__name__)
@@ -60,6 +75,13 @@ _OVERDUE_SHEET_PATTERN = re.compile(
 
 _MANAGERS_SHEET = "Managers"
 
+# Contact-cell parsing: "Name (Title)" lines and email separators.
+_PAREN_TITLE_PATTERN = re.compile(r"^(.+?)\s*\(([^)]+)\)\s*$")
+_EMAIL_SPLIT_PATTERN = re.compile(r"[\n,;]+")
+
+# Trailing periods/whitespace dropped by _normalize_name().
+_TRAILING_PUNCT_PATTERN = re.compile(r"[.\s]+$")
+
 # Column header aliases -- mapped by *header text* so we are resilient
 # to column reordering across weekly snapshots.
 _OVERDUE_HEADERS: dict[str, list[str]] = {
@@ -105,11 +127,26 @@ _NULL_SIGNALS: set[str | None] = {"", "#N/A", "N/A", "#REF!", None}
 # Keywords indicating an AR-focused contact (for primary selection).
 _AR_TITLE_KEYWORDS = ["ap", "accounting", "finance", "billing", "accounts payable"]
 
+# Parsed workbooks kept by load_workbook(), keyed on the file's identity
+# and version; see _workbook_cache_key().
+WORKBOOK_CACHE_SIZE = 4
+_workbook_cache: OrderedDict[tuple, LoadResult] = OrderedDict()
+# Guards _workbook_cache; load_workbook() may run on several threads.
+_workbook_cache_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Result container
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True, frozen=True)
+class _ResolverInvoice:
+    """Minimal invoice record in the shape the contact resolver reads."""
+    order_no: int
+    location: str
+    license_number: str = ""
+
+
 @dataclass
 class LoadResult:
     """Aggregated output from :func:`load_workbook`."""
@@ -146,13 +183,62 @@ class LoadResult:
     def actionable_invoices(self) -> list[Invoice]:
         return [i for i in self.invoices if i.is_sendable]
 
+    @property
+    def resolver_view(self) -> list[_ResolverInvoice]:
+        """Invoices as the lightweight records the contact resolver reads."""
+        return [
+            _ResolverInvoice(int(i.invoice_number), i.store_name, i.license_number)
+            for i in self.invoices
+        ]
+
     @property
     def total_ar(self) -> float:
         return sum(i.amount for i in self.invoices)
 
     @property
     def unpaid_ar(self) -> float:
-        return sum(i.amount for i in self.unpaid_invoices)
+        return sum(i.amount for i in self.invoices if not i.paid)
+
+    @property
+    def invoices_by_store(self) -> dict[str, list[Invoice]]:
+        """Invoices grouped by store_name, stores in first-seen order."""
+        by_store: dict[str, list[Invoice]] = {}
+        for inv in self.invoices:
+            by_store.setdefault(inv.store_name, []).append(inv)
+        return by_store
+
+    @property
+    def invoices_by_number(self) -> dict[str, Invoice]:
+        """First invoice seen for each invoice_number."""
+        by_number: dict[str, Invoice] = {}
+        for inv in self.invoices:
+            by_number.setdefault(inv.invoice_number, inv)
+        return by_number
+
+    @property
+    def multi_invoice_stores(self) -> frozenset[str]:
+        """Stores with more than one invoice in this load."""
+        counts = Counter(i.store_name for i in self.invoices)
+        return frozenset(store for store, count in counts.items() if count > 1)
+
+    @property
+    def tier_counts(self) -> dict[Tier, int]:
+        """Invoice count per tier (every tier present), in one pass."""
+        counts = Counter(i.tier for i in self.invoices)
+        return {tier: counts[tier] for tier in Tier}
+
+    @property
+    def skip_counts(self) -> dict[SkipReason, int]:
+        """Invoice count per skip reason (every reason present), in one pass."""
+        counts = Counter(i.skip_reason for i in self.invoices)
+        return {reason: counts[reason] for reason in SkipReason}
+
+    def get_invoice(self, invoice_number: str) -> Invoice | None:
+        """Look up an invoice by its order number (first occurrence)."""
+        for inv in self.invoices:
+            if inv.invoice_number == invoice_number:
+                return inv
+        return None
 
     def get_contact(self, store_name: str) -> Contact | None:
         """Look up a contact by store name with fuzzy matching."""
@@ -161,15 +247,11 @@ class LoadResult:
     def print_summary(self) -> None:
         """Print a human-readable summary of what was loaded."""
         unique_locations = {i.store_name for i in self.invoices}
-        tier_counts: dict[str, int] = {}
-        for inv in self.invoices:
-            tier_counts[inv.tier.value] = tier_counts.get(inv.tier.value, 0) + 1
-
-        skip_counts: dict[str, int] = {}
-        for inv in self.invoices:
-            if inv.skip_reason is not None:
-                label = inv.skip_reason.value
-                skip_counts[label] = skip_counts.get(label, 0) + 1
+        tier_counts = self.tier_counts
+        skip_counts = {
+            reason.value: count
+            for reason, count in self.skip_counts.items() if count
+        }
 
         print("=" * 65)
         print("  AR Email Automation -- Data Load Summary")
@@ -196,8 +278,7 @@ class LoadResult:
             print(f"  Unmatched stores  : {', '.join(self.unmatched_locations)}")
         print("-" * 65)
         print("  Tier distribution:")
-        for tier in Tier:
-            count = tier_counts.get(tier.value, 0)
+        for tier, count in tier_counts.items():
             if count:
                 print(f"    {tier.value:<22s}: {count}")
         if skip_counts:
@@ -241,89 +322,161 @@ def load_workbook(
     LoadResult
         Container with parsed invoices, contacts, matching diagnostics,
         and a ``print_summary()`` helper.
+
+    Notes
+    -----
+    Results for file paths are memoized on (real path, mtime, size,
+    sheet), so reloading an unchanged file skips the parse.  The cache
+    keeps the parsed result itself and every call returns its own deep
+    copy, so callers may mutate the result freely.  Use
+    :func:`clear_workbook_cache` to drop the cache.
     """
-    result = LoadResult()
+    key = _workbook_cache_key(source, overdue_sheet)
+    if key is None:
+        return _load_workbook_uncached(source, overdue_sheet)
 
-    # ------------------------------------------------------------------
-    # 1. Open workbook
-    # ------------------------------------------------------------------
-    wb = _open_workbook(source)
-    if isinstance(source, (str, Path)):
-        result.source_file = str(source)
+    with _workbook_cache_lock:
+        cached = _workbook_cache.get(key)
+        if cached is not None:
+            _workbook_cache.move_to_end(key)
+    if cached is not None:
+        logger.info("Using cached parse of %s", source)
+        return copy.deepcopy(cached)
 
-    # ------------------------------------------------------------------
-    # 2. Select the overdue sheet
-    # ------------------------------------------------------------------
-    if overdue_sheet:
-        if overdue_sheet not in wb.sheetnames:
-            raise ValueError(
-                f"Sheet '{overdue_sheet}' not found.  "
-                f"Available: {wb.sheetnames}"
-            )
-        ws_overdue = wb[overdue_sheet]
-        result.overdue_sheet_used = overdue_sheet
-    else:
-        ws_overdue, sheet_name = _find_most_recent_overdue_sheet(wb)
-        result.overdue_sheet_used = sheet_name
+    result = _load_workbook_uncached(source, overdue_sheet)
+    with _workbook_cache_lock:
+        _workbook_cache[key] = result
+        if len(_workbook_cache) > WORKBOOK_CACHE_SIZE:
+            _workbook_cache.popitem(last=False)
+    return copy.deepcopy(result)
 
-    logger.info("Using overdue sheet: %s", result.overdue_sheet_used)
 
-    # ------------------------------------------------------------------
-    # 3. Parse invoices
-    # ------------------------------------------------------------------
-    invoices, scan_meta = _parse_invoices(ws_overdue)
-    result.total_rows_scanned = scan_meta["rows_scanned"]
-    result.empty_rows_skipped = scan_meta["empty_rows"]
-    result.warnings.extend(scan_meta["warnings"])
-    result.invoices = invoices
+def clear_workbook_cache() -> None:
+    """Forget every memoized :func:`load_workbook` result."""
+    with _workbook_cache_lock:
+        _workbook_cache.clear()
 
-    # ------------------------------------------------------------------
-    # 4. Parse contacts from Managers sheet
-    # ------------------------------------------------------------------
-    if _MANAGERS_SHEET in wb.sheetnames:
-        contacts, contact_warnings = _parse_contacts(wb[_MANAGERS_SHEET])
-        result.contacts = contacts
-        result.warnings.extend(contact_warnings)
-
-        # Build lookup dict keyed on normalized retailer name
-        for c in contacts:
-            norm = _normalize_name(c.store_name)
-            result.contacts_by_name[norm] = c
-    else:
-        result.warnings.append(
-            f"Sheet '{_MANAGERS_SHEET}' not found -- contact data unavailable"
-        )
+
+def _workbook_cache_key(
+    source: Union[str, Path, IO[bytes]],
+    overdue_sheet: str | None,
+) -> tuple | None:
+    """Cache key for a path source, or None if it should not be cached.
+
+    Buffers are never cached.  The key changes whenever the file is
+    rewritten (mtime) or resized, so edits are picked up on next load.
+    """
+    if not isinstance(source, (str, Path)):
+        return None
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None  # let the loader raise its usual FileNotFoundError
+    return (os.path.realpath(source), st.st_mtime_ns, st.st_size, overdue_sheet)
+
+
+def _load_workbook_uncached(
+    source: Union[str, Path, IO[bytes]],
+    overdue_sheet: str | None,
+) -> LoadResult:
+    """Parse the workbook; the body of :func:`load_workbook`."""
+    result = LoadResult()
 
     # ------------------------------------------------------------------
-    # 5. Match invoice locations to contacts
+    # 1. Open workbook
     # ------------------------------------------------------------------
-    seen_locations: set[str] = set()
-    for inv in result.invoices:
-        if inv.store_name in seen_locations:
-            continue
-        seen_locations.add(inv.store_name)
+    wb = _open_workbook(source)
+    if isinstance(source, (str, Path)):
+        result.source_file = str(source)
 
-        contact = _lookup_contact(inv.store_name, result.contacts_by_name)
-        if contact is not None:
-            result.matched_locations.append(inv.store_name)
+    try:
+        # ------------------------------------------------------------------
+        # 2. Select the overdue sheet
+        # ------------------------------------------------------------------
+        if overdue_sheet:
+            if overdue_sheet not in wb.sheetnames:
+                raise ValueError(
+                    f"Sheet '{overdue_sheet}' not found.  "
+                    f"Available: {wb.sheetnames}"
+                )
+            ws_overdue = wb[overdue_sheet]
+            result.overdue_sheet_used = overdue_sheet
+        else:
+            ws_overdue, sheet_name = _find_most_recent_overdue_sheet(wb)
+            result.overdue_sheet_used = sheet_name
+
+        logger.info("Using overdue sheet: %s", result.overdue_sheet_used)
+
+        # ------------------------------------------------------------------
+        # 3. Parse invoices
+        # ------------------------------------------------------------------
+        invoices, scan_meta = _parse_invoices(ws_overdue)
+        result.total_rows_scanned = scan_meta["rows_scanned"]
+        result.empty_rows_skipped = scan_meta["empty_rows"]
+        result.warnings.extend(scan_meta["warnings"])
+        result.invoices = invoices
+
+        # ------------------------------------------------------------------
+        # 4. Parse contacts from Managers sheet
+        # ------------------------------------------------------------------
+        if _MANAGERS_SHEET in wb.sheetnames:
+            contacts, contact_warnings = _parse_contacts(wb[_MANAGERS_SHEET])
+            result.contacts = contacts
+            result.warnings.extend(contact_warnings)
+
+            # Build lookup dict keyed on normalized retailer name
+            for c in contacts:
+                norm = _normalize_name(c.store_name)
+                result.contacts_by_name[norm] = c
         else:
-            result.unmatched_locations.append(inv.store_name)
-            logger.warning("No contact match for location: %s", inv.store_name)
+            result.warnings.append(
+                f"Sheet '{_MANAGERS_SHEET}' not found -- contact data unavailable"
+            )
 
-    wb.close()
+        # ------------------------------------------------------------------
+        # 5. Match invoice locations to contacts
+        # ------------------------------------------------------------------
+        for location in dict.fromkeys(inv.store_name for inv in invoices):
+            contact = _lookup_contact(location, result.contacts_by_name)
+            if contact is not None:
+                result.matched_locations.append(location)
+            else:
+                result.unmatched_locations.append(location)
+                logger.warning("No contact match for location: %s", location)
+    finally:
+        wb.close()
     return result
 
 
 def load_contacts_only(
     source: Union[str, Path, IO[bytes]],
 ) -> list[Contact]:
-    """Load only the Managers (contact) sheet -- useful for testing."""
+    """Load only the Managers (contact) sheet -- useful for testing.
+
+    Reuses the contacts of a memoized :func:`load_workbook` parse of the
+    same file version when one exists.
+    """
+    key = _workbook_cache_key(source, None)
+    if key is not None:
+        with _workbook_cache_lock:
+            cached_contacts = next(
+                (
+                    cached.contacts
+                    for cached_key, cached in _workbook_cache.items()
+                    if cached_key[:3] == key[:3] and cached.contacts
+                ),
+                None,
+            )
+        if cached_contacts is not None:
+            return copy.deepcopy(cached_contacts)
+
     wb = _open_workbook(source)
-    if _MANAGERS_SHEET not in wb.sheetnames:
+    try:
+        if _MANAGERS_SHEET not in wb.sheetnames:
+            raise ValueError(f"Sheet '{_MANAGERS_SHEET}' not found in workbook.")
+        contacts, _ = _parse_contacts(wb[_MANAGERS_SHEET])
+    finally:
         wb.close()
-        raise ValueError(f"Sheet '{_MANAGERS_SHEET}' not found in workbook.")
-    contacts, _ = _parse_contacts(wb[_MANAGERS_SHEET])
-    wb.close()
     return contacts
 
 
@@ -339,18 +492,116 @@ def lookup_contact(
 # Workbook opening
 # ---------------------------------------------------------------------------
 
-def _open_workbook(source: Union[str, Path, IO[bytes]]) -> Workbook:
-    """Open an openpyxl Workbook from a file path or bytes buffer."""
+def _open_workbook(
+    source: Union[str, Path, IO[bytes]],
+) -> Union[Workbook, _CalamineBook]:
+    """Open a workbook from a file path or bytes buffer.
+
+    Uses python-calamine when installed; otherwise openpyxl, opened
+    read-only so rows are streamed from the archive as plain values
+    without building styled ``Cell`` objects for the whole sheet.
+    Either way the result exposes ``sheetnames``, ``wb[name]`` and
+    ``close()``; callers must close it once parsing is done.
+    """
     if isinstance(source, (str, Path)):
         path = Path(source)
         if not path.exists():
             raise FileNotFoundError(f"XLSX file not found: {path}")
         logger.info("Opening XLSX file: %s", path)
-        return openpyxl.load_workbook(path, data_only=True, read_only=False)
+        if _HAS_CALAMINE:
+            return _CalamineBook(CalamineWorkbook.from_path(str(path)))
+        return openpyxl.load_workbook(
+            path, data_only=True, read_only=True, keep_links=False,
+        )
 
     # Bytes buffer (BytesIO or similar)
     logger.info("Opening XLSX from bytes buffer")
-    return openpyxl.load_workbook(source, data_only=True, read_only=False)
+    if _HAS_CALAMINE:
+        return _CalamineBook(CalamineWorkbook.from_filelike(source))
+    return openpyxl.load_workbook(
+        source, data_only=True, read_only=True, keep_links=False,
+    )
+
+
+class _CalamineBook:
+    """Minimal openpyxl-``Workbook``-shaped view of a CalamineWorkbook."""
+
+    def __init__(self, book) -> None:
+        self._book = book
+        self.sheetnames: list[str] = list(book.sheet_names)
+
+    def __getitem__(self, name: str) -> _CalamineSheet:
+        if name not in self.sheetnames:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        return _CalamineSheet(name, self._book.get_sheet_by_name(name))
+
+    def close(self) -> None:
+        close = getattr(self._book, "close", None)
+        if close is not None:
+            close()
+
+
+class _CalamineSheet:
+    """Values-only view of a calamine sheet, read via :func:`_iter_row_values`.
+
+    Values are mapped to what openpyxl would return so the parsers (and
+    their warning text) see identical input: blank cells come back from
+    calamine as ``""`` and become ``None``; whole-number floats become
+    ``int``.
+    """
+
+    def __init__(self, title: str, sheet) -> None:
+        self.title = title
+        self._sheet = sheet
+        self._rows: list[list] | None = None
+
+    def iter_values(self, min_row: int = 1, max_row: int | None = None):
+        """Yield row value tuples, like openpyxl's ``values_only=True``."""
+        if self._rows is None:
+            # Convert the sheet once; the header lookups and the data pass
+            # all slice the same rows. skip_empty_area=False keeps row 1 /
+            # column A anchored at index 0.
+            self._rows = self._sheet.to_python(skip_empty_area=False)
+        for row in self._rows[min_row - 1:max_row]:
+            yield tuple(_calamine_value(v) for v in row)
+
+
+def _calamine_value(val):
+    """Map one calamine cell value onto openpyxl's representation."""
+    if val == "":
+        return None
+    if type(val) is float and val.is_integer():
+        return int(val)
+    return val
+
+
+def _iter_row_values(
+    ws: Union[Worksheet, _CalamineSheet],
+    min_row: int = 1,
+    max_row: int | None = None,
+):
+    """Yield ``(row_number, values_tuple)`` for worksheet rows.
+
+    Some writers store a bogus ``A1:A1`` dimension, which would make a
+    read-only sheet look empty; reset it so every row is streamed.
+    """
+    if isinstance(ws, _CalamineSheet):
+        rows = ws.iter_values(min_row=min_row, max_row=max_row)
+        return enumerate(rows, start=min_row)
+    if (
+        hasattr(ws, "reset_dimensions")
+        and ws.max_row == 1 and ws.max_column == 1
+    ):
+        ws.reset_dimensions()
+    rows = ws.iter_rows(min_row=min_row, max_row=max_row, values_only=True)
+    return enumerate(rows, start=min_row)
+
+
+def _header_values(ws: Worksheet) -> tuple:
+    """Raw values of the worksheet's header row (row 1)."""
+    for _row_num, values in _iter_row_values(ws, min_row=1, max_row=1):
+        return values
+    return ()
 
 
 # ---------------------------------------------------------------------------
@@ -416,13 +667,13 @@ def _parse_invoices(ws: Worksheet) -> tuple[list[Invoice], dict]:
     if missing_required:
         raise ValueError(
             f"Required columns not found in overdue sheet: {missing_required}.  "
-            f"Header row: {[cell.value for cell in ws[1]]}"
+            f"Header row: {list(_header_values(ws))}"
         )
 
     rows_scanned = 0
     empty_rows = 0
 
-    for row in ws.iter_rows(min_row=2, values_only=False):
+    for row_num, row in _iter_row_values(ws, min_row=2):
         rows_scanned += 1
 
         # -- Order No: if null this is a padding row --
@@ -437,7 +688,7 @@ def _parse_invoices(ws: Worksheet) -> tuple[list[Invoice], dict]:
             invoice_number = str(order_no_int)
         except (ValueError, TypeError):
             warnings.append(
-                f"Row {row[0].row}: cannot parse Order No "
+                f"Row {row_num}: cannot parse Order No "
                 f"'{order_no_raw}' -- skipping"
             )
             empty_rows += 1
@@ -445,10 +696,12 @@ def _parse_invoices(ws: Worksheet) -> tuple[list[Invoice], dict]:
 
         # -- Location --
         location_raw = _cell_value(row, header_map, "location")
-        store_name = _clean_str(location_raw)
+        # Interned: a store's invoices share one string object, so grouping
+        # and equality checks on store_name usually hit the identity path.
+        store_name = sys.intern(_clean_str(location_raw))
         if not store_name:
             warnings.append(
-                f"Row {row[0].row}: Order {invoice_number} has empty "
+                f"Row {row_num}: Order {invoice_number} has empty "
                 f"Location -- skipping"
             )
             empty_rows += 1
@@ -462,7 +715,7 @@ def _parse_invoices(ws: Worksheet) -> tuple[list[Invoice], dict]:
         # -- Dates & aging --
         due_date = _parse_date(
             _cell_value(row, header_map, "due_date"),
-            f"Row {row[0].row} Due Date", warnings,
+            f"Row {row_num} Due Date", warnings,
         )
         days_past_due = _parse_int(
             _cell_value(row, header_map, "days_over"), default=0
@@ -495,7 +748,7 @@ def _parse_invoices(ws: Worksheet) -> tuple[list[Invoice], dict]:
         )
         follow_up_date = _parse_date(
             _cell_value(row, header_map, "follow_up_date"),
-            f"Row {row[0].row} F/U Date", warnings,
+            f"Row {row_num} F/U Date", warnings,
         )
 
         # Build the Invoice object.
@@ -521,7 +774,7 @@ def _parse_invoices(ws: Worksheet) -> tuple[list[Invoice], dict]:
         if inv.amount == 0.0 and _cell_value(row, header_map, "total_due") is not None:
             raw_val = _cell_value(row, header_map, "total_due")
             warnings.append(
-                f"Row {row[0].row}: Order {invoice_number} Total Due "
+                f"Row {row_num}: Order {invoice_number} Total Due "
                 f"parsed as $0.00 from '{raw_val}'"
             )
 
@@ -559,13 +812,13 @@ def _parse_contacts(ws: Worksheet) -> tuple[list[Contact], list[str]]:
     if "retailer_name" not in header_map:
         warnings.append(
             "Managers sheet: 'Retailer Name (DBA)' column not found.  "
-            f"Header row: {[cell.value for cell in ws[1]]}"
+            f"Header row: {list(_header_values(ws))}"
         )
         return contacts, warnings
 
-    for row in ws.iter_rows(min_row=2, values_only=False):
+    for _row_num, row in _iter_row_values(ws, min_row=2):
         name_raw = _cell_value(row, header_map, "retailer_name")
-        retailer_name = _clean_str(name_raw)
+        retailer_name = sys.intern(_clean_str(name_raw))
         if not retailer_name:
             continue  # skip empty / padding rows
 
@@ -650,7 +903,7 @@ def _parse_poc_names(raw: str) -> list[dict[str, str]]:
         name = line
 
         # Parenthesized title: "Emily Stratakos (AP)"
-        paren_match = re.match(r"^(.+?)\s*\(([^)]+)\)\s*$", line)
+        paren_match = _PAREN_TITLE_PATTERN.match(line)
         if paren_match:
             name = paren_match.group(1).strip()
             title = paren_match.group(2).strip()
@@ -705,7 +958,7 @@ def _parse_emails(raw: str) -> list[str]:
     emails: list[str] = []
     seen: set[str] = set()
 
-    for part in re.split(r"[\n,;]+", raw):
+    for part in _EMAIL_SPLIT_PATTERN.split(raw):
         email = part.strip().lower()
         if not email:
             continue
@@ -758,7 +1011,7 @@ def _normalize_name(name: str) -> str:
 
     Lowercases, strips trailing punctuation and extra whitespace.
     """
-    return re.sub(r"[.\s]+$", "", name.strip().lower())
+    return _TRAILING_PUNCT_PATTERN.sub("", name.strip().lower())
 
 
 def _lookup_contact(
@@ -805,10 +1058,10 @@ def _build_header_map(
     """
     header_map: dict[str, int] = {}
 
-    row1_values: list[str | None] = []
-    for cell in ws[1]:
-        val = cell.value
-        row1_values.append(str(val).strip() if val is not None else None)
+    row1_values: list[str | None] = [
+        str(val).strip() if val is not None else None
+        for val in _header_values(ws)
+    ]
 
     for logical_name, aliases in header_spec.items():
         for idx, header_text in enumerate(row1_values):
@@ -842,7 +1095,7 @@ def _cell_value(row, header_map: dict[str, int], field_name: str):
         return None
     if idx >= len(row):
         return None
-    return row[idx].value
+    return row[idx]
 
 
 # ---------------------------------------------------------------------------
@@ -1,7 +1,8 @@
 """Data models for the AR Email Automation system.
 
 All models are plain dataclasses with type hints.  No ORM, no Pydantic --
-just stdlib so the module has zero dependencies beyond Python 3.11+.
+just stdlib so the module has zero required dependencies beyond Python
+3.11+ (orjson, when installed, speeds up EmailQueue.export_json).
 
 Designed around the XLSX schema documented in:
   agent-outputs/04-xlsx-schema-analysis.md
@@ -12,12 +13,21 @@ Designed around the XLSX schema documented in:
 from __future__ import annotations
 
 import csv
+import io
 import json
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from enum import Enum
 from pathlib import Path
-from typing import Self
+from typing import Self, TextIO
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+    orjson = None
 
 
 # ---------------------------------------------------------------------------
@@ -272,7 +282,7 @@ class Contact:
         """
         if not raw:
             return []
-        return [addr.strip() for addr in raw.splitlines() if addr.strip()]
+        return [addr for line in raw.splitlines() if (addr := line.strip())]
 
     @classmethod
     def parse_multi_line_phones(cls, raw: str) -> list[str]:
@@ -286,7 +296,7 @@ class Contact:
         """
         if not raw:
             return []
-        return [line.strip() for line in raw.splitlines() if line.strip()]
+        return [phone for line in raw.splitlines() if (phone := line.strip())]
 
 
 @dataclass
@@ -504,6 +514,10 @@ class EmailQueue:
         """Append a draft to the queue."""
         self.drafts.append(draft)
 
+    def extend(self, drafts: Iterable[EmailDraft]) -> None:
+        """Append several drafts to the queue in order."""
+        self.drafts.extend(drafts)
+
     def approve_all(self) -> int:
         """Approve every pending draft.  Returns count approved."""
         count = 0
@@ -549,12 +563,12 @@ class EmailQueue:
 
     # --- export ---
 
-    def export_json(self, path: str | Path) -> Path:
-        """Write the full queue to a JSON file for review.
+    def to_json(self) -> str:
+        """Return the JSON document that :meth:`export_json` writes."""
+        return self._json_bytes().decode("utf-8")
 
-        Returns the Path written to.
-        """
-        path = Path(path)
+    def _json_bytes(self) -> bytes:
+        """Serialize the full queue (summary + drafts) as UTF-8 JSON."""
         data = {
             "generated_at": datetime.now().isoformat(),
             "summary": {
@@ -567,17 +581,28 @@ class EmailQueue:
             },
             "drafts": [d.to_dict() for d in self.drafts],
         }
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-        return path
+        if _HAS_ORJSON:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
-    def export_csv(self, path: str | Path) -> Path:
-        """Write a summary CSV for quick spreadsheet review.
+    def export_json(self, path: str | Path) -> Path:
+        """Write the full queue to a JSON file for review.
 
-        One row per draft with key fields.  Returns the Path written to.
+        Returns the Path written to.
         """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self._json_bytes())
+        return path
+
+    def to_csv(self) -> str:
+        """Return the summary CSV that :meth:`export_csv` writes."""
+        buf = io.StringIO()
+        self.write_csv(buf)
+        return buf.getvalue()
+
+    def write_csv(self, fh: TextIO) -> None:
+        """Write the summary CSV (see :meth:`export_csv`) to an open text stream."""
         fieldnames = [
             "index",
             "store_name",
@@ -588,20 +613,29 @@ class EmailQueue:
             "status",
             "rejection_reason",
         ]
+        writer = csv.DictWriter(fh, fieldnames=fieldnames)
+        writer.writeheader()
+        for i, d in enumerate(self.drafts):
+            writer.writerow({
+                "index": i,
+                "store_name": d.store_name,
+                "tier": d.tier.value,
+                "invoice_numbers": "; ".join(d.invoice_numbers),
+                "total_amount": d.total_amount_formatted,
+                "to": "; ".join(d.to),
+                "status": d.status.value,
+                "rejection_reason": d.rejection_reason,
+            })
+
+    def export_csv(self, path: str | Path) -> Path:
+        """Write a summary CSV for quick spreadsheet review.
+
+        One row per draft with key fields.  Returns the Path written to.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(fh, fieldnames=fieldnames)
-            writer.writeheader()
-            for i, d in enumerate(self.drafts):
-                writer.writerow({
-                    "index": i,
-                    "store_name": d.store_name,
-                    "tier": d.tier.value,
-                    "invoice_numbers": "; ".join(d.invoice_numbers),
-                    "total_amount": d.total_amount_formatted,
-                    "to": "; ".join(d.to),
-                    "status": d.status.value,
-                    "rejection_reason": d.rejection_reason,
-                })
+            self.write_csv(fh)
         return path
 
     def summary(self) -> str:
@@ -14,9 +14,11 @@ Subject lines for 30+ use dynamic buckets: 30+, 40+, 50+, etc.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any
 
 
 # ---------------------------------------------------------------------------
@@ -67,7 +69,7 @@ class UrgencyLevel(str, Enum):
 # CC Rules
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CCRules:
     """
     Defines who gets CC'd on an email for a given tier.
@@ -92,7 +94,7 @@ class CCRules:
 # Tier Metadata
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TierMetadata:
     """
     All metadata associated with a single AR tier.
@@ -116,7 +118,7 @@ class TierMetadata:
     cc_rules: CCRules
     subject_label: str
     includes_ocm_warning: bool
-    days_until_ocm_report: Optional[int]
+    days_until_ocm_report: int | None
     description: str
     recommended_follow_up: str
 
@@ -197,11 +199,14 @@ TIER_METADATA: dict[Tier, TierMetadata] = {
 # Classification Result
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClassificationResult:
     """
     The result of classifying a single invoice.
 
+    Frozen because classify() memoizes results and shares them between
+    callers.
+
     Attributes:
         tier: The assigned tier.
         metadata: Full tier metadata (template, urgency, CC rules, etc.).
@@ -214,19 +219,52 @@ class ClassificationResult:
     tier: Tier
     metadata: TierMetadata
     days_past_due: int
-    days_until_ocm: Optional[int]
+    days_until_ocm: int | None
     is_past_ocm_deadline: bool
     input_was_null: bool = False
 
 
+# ---------------------------------------------------------------------------
+# Batch lookup tables
+# ---------------------------------------------------------------------------
+# Tier index order shared by the lookup tables below.
+_TIER_BY_INDEX: tuple[Tier, ...] = (Tier.COMING_DUE, Tier.OVERDUE, Tier.PAST_DUE)
+
+# TIER_METADATA in the same index order, so hot paths can index instead of
+# hashing the Tier key.
+_TIER_META: tuple[TierMetadata, ...] = tuple(TIER_METADATA[t] for t in _TIER_BY_INDEX)
+
+# The keys classify_batch() adds to each invoice, per tier index, in output
+# order.  The two OCM entries are placeholders filled in per invoice.
+_TIER_FIELDS: tuple[dict[str, Any], ...] = tuple(
+    {
+        "tier": tier,
+        "tier_label": tier.value,
+        "template_name": meta.template_name,
+        "urgency_level": meta.urgency_level,
+        "days_until_ocm": None,
+        "is_past_ocm_deadline": False,
+        "cc_rules": meta.cc_rules,
+        "subject_label": meta.subject_label,
+        "includes_ocm_warning": meta.includes_ocm_warning,
+        "recommended_follow_up": meta.recommended_follow_up,
+    }
+    for tier, meta in zip(_TIER_BY_INDEX, _TIER_META)
+)
+
+
 # ---------------------------------------------------------------------------
 # Core Classification Functions
 # ---------------------------------------------------------------------------
 
-def classify(days_past_due: Optional[int | float]) -> ClassificationResult:
+@lru_cache(maxsize=512)
+def classify(days_past_due: int | float | None) -> ClassificationResult:
     """
     Classify a single invoice into an AR tier based on days_past_due.
 
+    Results are memoized per input value; real sheets only hold a few
+    dozen distinct day counts.
+
     Args:
         days_past_due: Number of days past the invoice due date.
             - Negative values mean the invoice is not yet due.
@@ -270,14 +308,14 @@ def classify(days_past_due: Optional[int | float]) -> ClassificationResult:
 
     days_past_due = int(days_past_due)
 
-    # Determine tier (3-tier system)
+    # Determine tier index into _TIER_BY_INDEX / _TIER_META (3-tier system)
     if days_past_due >= TIER_BOUNDARY_PAST_DUE_30:
-        tier = Tier.PAST_DUE
+        idx = 2
     elif days_past_due >= TIER_BOUNDARY_OVERDUE:
-        tier = Tier.OVERDUE
+        idx = 1
     else:
         # days_past_due <= 0: not yet due, or due today
-        tier = Tier.COMING_DUE
+        idx = 0
 
     # Calculate OCM-specific fields
     if days_past_due > 0:
@@ -288,8 +326,8 @@ def classify(days_past_due: Optional[int | float]) -> ClassificationResult:
         is_past_ocm_deadline = False
 
     return ClassificationResult(
-        tier=tier,
-        metadata=TIER_METADATA[tier],
+        tier=_TIER_BY_INDEX[idx],
+        metadata=_TIER_META[idx],
         days_past_due=days_past_due,
         days_until_ocm=days_until_ocm,
         is_past_ocm_deadline=is_past_ocm_deadline,
@@ -297,6 +335,21 @@ def classify(days_past_due: Optional[int | float]) -> ClassificationResult:
     )
 
 
+@lru_cache(maxsize=512)
+def _batch_fields(days_past_due: int | float | None) -> dict[str, Any]:
+    """
+    The keys classify_batch() adds for one days_past_due value.
+
+    Cached like classify(); callers copy it with ``dict.update`` and must
+    not mutate the returned dict.
+    """
+    result = classify(days_past_due)
+    fields = dict(_TIER_FIELDS[_TIER_BY_INDEX.index(result.tier)])
+    fields["days_until_ocm"] = result.days_until_ocm
+    fields["is_past_ocm_deadline"] = result.is_past_ocm_deadline
+    return fields
+
+
 def classify_batch(
     invoices: list[dict[str, Any]],
     days_field: str = "days_past_due",
@@ -355,15 +408,22 @@ def classify_batch(
         >>> results[3]["_skip_reason"]
         'payment_enroute'
     """
+    # Module-level callables bound once as locals for the per-row loop.
+    get_skip_reason = _get_skip_reason
+    batch_fields = _batch_fields
+    row_fields = itemgetter(days_field, paid_field, status_field)
+
     for invoice in invoices:
+        try:
+            days, paid, status = row_fields(invoice)
+        except KeyError:
+            # Missing fields read as None, matching dict.get().
+            days = invoice.get(days_field)
+            paid = invoice.get(paid_field)
+            status = invoice.get(status_field)
+
         # --- Skip logic ---
-        skip_reason = _get_skip_reason(
-            invoice,
-            skip_paid=skip_paid,
-            paid_field=paid_field,
-            skip_payment_enroute=skip_payment_enroute,
-            status_field=status_field,
-        )
+        skip_reason = get_skip_reason(paid, status, skip_paid, skip_payment_enroute)
 
         if skip_reason is not None:
             invoice["_skipped"] = True
@@ -375,49 +435,42 @@ def classify_batch(
             invoice["_skip_reason"] = None
 
         # --- Classify ---
-        days_value = invoice.get(days_field)
-        result = classify(days_value)
-
-        invoice["tier"] = result.tier
-        invoice["tier_label"] = result.tier.value
-        invoice["template_name"] = result.metadata.template_name
-        invoice["urgency_level"] = result.metadata.urgency_level
-        invoice["days_until_ocm"] = result.days_until_ocm
-        invoice["is_past_ocm_deadline"] = result.is_past_ocm_deadline
-        invoice["cc_rules"] = result.metadata.cc_rules
-        invoice["subject_label"] = result.metadata.subject_label
-        invoice["includes_ocm_warning"] = result.metadata.includes_ocm_warning
-        invoice["recommended_follow_up"] = result.metadata.recommended_follow_up
+        if days != days:
+            # Each NaN is unequal to every cache key; share None's entry
+            # (classified identically) instead of filling new LRU slots.
+            days = None
+        invoice.update(batch_fields(days))
 
     return invoices
 
 
+# Lowercased cell values that mark an invoice as paid / payment enroute.
+_PAID_STRINGS: frozenset[str] = frozenset({"true", "yes", "1", "paid"})
+_PAYMENT_ENROUTE_STATUS: str = "payment enroute"
+
+
 def _get_skip_reason(
-    invoice: dict[str, Any],
-    *,
+    paid_value: Any,
+    status_value: Any,
     skip_paid: bool,
-    paid_field: str,
     skip_payment_enroute: bool,
-    status_field: str,
-) -> Optional[str]:
+) -> str | None:
     """
     Determine whether an invoice should be skipped for email sending.
 
-    Returns a reason string if the invoice should be skipped, or None if
-    it should be processed.
+    Takes the invoice's paid and status values.  Returns a reason string if
+    the invoice should be skipped, or None if it should be processed.
     """
     # Check paid status
     if skip_paid:
-        paid_value = invoice.get(paid_field)
         if paid_value is True or (
-            isinstance(paid_value, str) and paid_value.lower() in ("true", "yes", "1", "paid")
+            isinstance(paid_value, str) and paid_value.lower() in _PAID_STRINGS
         ):
             return "paid"
 
     # Check payment enroute
     if skip_payment_enroute:
-        status_value = invoice.get(status_field)
-        if isinstance(status_value, str) and status_value.strip().lower() == "payment enroute":
+        if isinstance(status_value, str) and status_value.strip().lower() == _PAYMENT_ENROUTE_STATUS:
             return "payment_enroute"
 
     return None
@@ -427,6 +480,12 @@ def _get_skip_reason(
 # Dynamic Subject Label Generator
 # ---------------------------------------------------------------------------
 
+# Precomputed "{N}0+ Days Past Due" labels, indexed by days // 10, so the
+# common integer case is a tuple lookup instead of a format per call.
+_DECADE_LABELS: tuple[str, ...] = tuple(f"{i * 10}+ Days Past Due" for i in range(200))
+_DECADE_LABELS_LIMIT: int = len(_DECADE_LABELS) * 10
+
+
 def get_dynamic_subject_label(days_past_due: int) -> str:
     """
     Compute the dynamic subject line label for email subject lines.
@@ -452,6 +511,8 @@ def get_dynamic_subject_label(days_past_due: int) -> str:
         return "Coming Due"
     if days_past_due <= 29:
         return "Overdue"
+    if type(days_past_due) is int and days_past_due < _DECADE_LABELS_LIMIT:
+        return _DECADE_LABELS[days_past_due // 10]
     bucket = (days_past_due // 10) * 10
     return f"{bucket}+ Days Past Due"
 
@@ -501,27 +562,35 @@ def summarize_batch(invoices: list[dict[str, Any]]) -> dict[str, Any]:
             "invoices": [],
         }
 
+    # Bind lookups once; this loop runs per invoice on nightly batches.
+    _get = dict.get
+    tiers = summary["tiers"]
+    total_skipped = 0
+    total_actionable = 0
+
     for inv in invoices:
-        tier_label = inv.get("tier_label")
+        tier_label = _get(inv, "tier_label")
         if tier_label is None:
             continue
 
-        tier_data = summary["tiers"].get(tier_label)
+        tier_data = _get(tiers, tier_label)
         if tier_data is None:
             continue
 
         tier_data["count"] += 1
-        tier_data["total_due"] += inv.get("total_due", 0.0) or 0.0
+        tier_data["total_due"] += _get(inv, "total_due", 0.0) or 0.0
 
-        if inv.get("_skipped"):
+        if _get(inv, "_skipped"):
             tier_data["skipped_count"] += 1
-            summary["total_skipped"] += 1
+            total_skipped += 1
         else:
             tier_data["actionable_count"] += 1
-            summary["total_actionable"] += 1
+            total_actionable += 1
 
-        tier_data["invoices"].append(inv.get("order_no", "unknown"))
+        tier_data["invoices"].append(_get(inv, "order_no", "unknown"))
 
+    summary["total_skipped"] = total_skipped
+    summary["total_actionable"] = total_actionable
     return summary
 
 
@@ -529,7 +598,7 @@ def summarize_batch(invoices: list[dict[str, Any]]) -> dict[str, Any]:
 # Convenience: get tier for a single value without full result object
 # ---------------------------------------------------------------------------
 
-def get_tier(days_past_due: Optional[int | float]) -> Tier:
+def get_tier(days_past_due: int | float | None) -> Tier:
     """
     Quick lookup: return just the Tier enum for a given days_past_due value.
 
@@ -0,0 +1,26 @@
+"""Shared pytest fixtures for the AR Email Automation test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from src.data_loader import LoadResult, load_workbook
+
+
+# The actual XLSX file from the project data directory.
+XLSX_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "data"
+    / "NY Account Receivables_Overdue.xlsx"
+)
+
+
+@pytest.fixture(scope="session")
+def xlsx_load_result() -> LoadResult:
+    """Parse the production workbook once for the whole test session.
+
+    Tests must treat the result as read-only; it is shared by every test
+    module.  Only requested by ``requires_xlsx`` tests, so a missing file
+    skips them before this fixture runs.
+    """
+    return load_workbook(str(XLSX_PATH))
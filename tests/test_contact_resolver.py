@@ -19,6 +19,7 @@ Covers:
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -50,6 +51,33 @@ from src.contact_resolver import (
 # Test Data Helpers
 # ============================================================================
 
+@dataclass(slots=True)
+class _MockContact:
+    """Slotted stand-in for a Managers-sheet Contact."""
+    retailer_name: str
+    store_name: str
+    license_number: str
+    email: str
+    contact_name: str
+    poc_name: str
+    poc_title: str
+    all_emails: list
+    all_contacts: list
+
+
+@dataclass(slots=True)
+class _MockInvoice:
+    """Slotted stand-in for an Invoice."""
+    order_no: int
+    location: str
+    license_number: str
+    days_past_due: int
+    total_due: float
+    paid: bool
+    status: Any
+    sales_rep: str
+
+
 def _make_contact(**overrides):
     """Create a mock contact object with reasonable defaults."""
     defaults = {
@@ -64,7 +92,7 @@ def _make_contact(**overrides):
         "all_contacts": [{"name": "Emily Stratakos", "title": "AP"}],
     }
     defaults.update(overrides)
-    return SimpleNamespace(**defaults)
+    return _MockContact(**defaults)
 
 
 def _make_invoice(**overrides):
@@ -80,7 +108,7 @@ def _make_invoice(**overrides):
         "sales_rep": "Ben",
     }
     defaults.update(overrides)
-    return SimpleNamespace(**defaults)
+    return _MockInvoice(**defaults)
 
 
 def _make_brand_ar_contact(**overrides):
@@ -339,6 +367,34 @@ class TestFuzzyMatching:
 
         assert result.match_tier == MatchTier.NO_MATCH
 
+    def test_pure_python_scan_matches_compute_similarity(self, monkeypatch):
+        """The length-bucket scan used without rapidfuzz/numpy finds the
+        same best candidate (earliest on ties) as scoring every name."""
+        monkeypatch.setattr("src.contact_resolver._HAS_RAPIDFUZZ", False)
+        monkeypatch.setattr("src.contact_resolver._HAS_NUMPY", False)
+        names = [
+            "The Travel Agency (SoHo)", "Travel Agency", "Seaweed RBNY",
+            "HUB Dispensary", "Hub Dispensary LLC", "Aroma Farms",
+            "Aroma Farm", "Dazed", "Dazed.", "Kush Kingdom Inc",
+        ]
+        resolver = ContactResolver(
+            [_make_contact(retailer_name=name) for name in names]
+        )
+        locations = [
+            "Travel Agency - SoHo", "HUB", "Aroma", "Daze", "Kush Kingdom",
+            "Seaweed", "Completely Unrelated Store",
+        ]
+
+        for location, (score, idx) in zip(
+            locations, resolver._score_locations(locations)
+        ):
+            expected = [
+                _compute_similarity(location, raw)
+                for raw, _norm, _contacts in resolver._name_candidates
+            ]
+            assert score == max(expected)
+            assert idx == expected.index(score)
+
 
 # ============================================================================
 # ContactResolver -- Fallback / No Match
@@ -525,6 +581,21 @@ class TestBatchResolution:
         assert len(report.matched[0].invoice_order_nos) == 2
         assert "Multi-invoice" in report.matched[0].notes
 
+    def test_ungrouped_duplicate_locations_get_own_results(self):
+        contacts = [_make_contact(retailer_name="Seaweed RBNY")]
+        invoices = [
+            _make_invoice(order_no=904667, location="Seaweed RBNY"),
+            _make_invoice(order_no=905055, location="Seaweed RBNY"),
+        ]
+
+        report = ContactResolver(contacts).resolve(invoices)
+
+        first, second = report.matched
+        assert first.invoice_order_nos == [904667]
+        assert second.invoice_order_nos == [905055]
+        assert first.to_emails == second.to_emails
+        assert first.to_emails is not second.to_emails
+
     def test_match_rate_calculation(self):
         contacts = [
             _make_contact(retailer_name="Aroma Farms Dispensary"),
@@ -550,6 +621,34 @@ class TestBatchResolution:
         assert "60%" in report.confidence_distribution
         assert "0% (unmatched)" in report.confidence_distribution
 
+    def test_batch_scoring_matches_single_invoice(self):
+        """Batch-scored fuzzy matches agree with per-invoice matching."""
+        contacts = [
+            _make_contact(retailer_name="The Travel Agency (SoHo)"),
+            _make_contact(retailer_name="Seaweed RBNY"),
+            _make_contact(retailer_name="HUB Dispensary"),
+        ]
+        locations = ["Travel Agency - SoHo", "Seaweed RBNY.", "Hub", "DeMarinos"]
+        invoices = [
+            _make_invoice(order_no=i, location=loc)
+            for i, loc in enumerate(locations)
+        ]
+
+        report = ContactResolver(contacts).resolve(invoices)
+        batch = {
+            r.invoice_location: (r.match_tier, r.fuzzy_score, r.notes)
+            for r in report.matched + report.unmatched
+        }
+        single_resolver = ContactResolver(contacts)
+        for inv in invoices:
+            single = single_resolver.match_invoice(inv)
+            assert batch[inv.location][:2] == (single.match_tier, single.fuzzy_score)
+            assert batch[inv.location][2].startswith(single.notes)
+            if single.matched_contact_name:
+                assert single.fuzzy_score == pytest.approx(
+                    _compute_similarity(inv.location, single.matched_contact_name)
+                )
+
     def test_empty_invoices(self):
         contacts = [_make_contact()]
         report = resolve_contacts([], contacts)
@@ -612,22 +711,23 @@ class TestRealDataContactResolution:
     """
 
     @pytest.fixture(scope="class")
-    def load_result(self):
-        from src.data_loader import load_workbook
-        return load_workbook(str(XLSX_PATH))
+    def load_result(self, xlsx_load_result):
+        """The workbook parsed once per session (see conftest.py)."""
+        return xlsx_load_result
 
     def test_resolution_with_real_data(self, load_result):
         """Run full contact resolution on real invoice and contact data."""
         contacts = load_result.contacts
         invoices = load_result.invoices
 
-        mock_invoices = []
-        for inv in invoices:
-            mock_invoices.append(SimpleNamespace(
+        mock_invoices = [
+            _make_invoice(
                 order_no=int(inv.invoice_number),
                 location=inv.store_name,
                 license_number="",
-            ))
+            )
+            for inv in invoices
+        ]
 
         report = resolve_contacts(
             mock_invoices, contacts, group_by_location=True,
@@ -714,6 +814,20 @@ class TestContactSOPPriorityChain:
         assert len(result.resolution_chain) > 0
         assert result.contact_source == "managers_sheet"
 
+    def test_recipients_follow_contact_changes(self):
+        """Re-resolving after a contact's emails change picks up the edit."""
+        contact = _make_contact(retailer_name="Test Store", email="old@test.com")
+        resolver = ContactResolver([contact])
+        invoice = _make_invoice(location="Test Store")
+
+        first = resolver.resolve_to_recipients(resolver.match_invoice(invoice))
+        contact.email = "new@test.com"
+        contact.all_contacts = [{"name": "Bob", "title": "AP", "email": "ap@test.com"}]
+        second = resolver.resolve_to_recipients(resolver.match_invoice(invoice))
+
+        assert first.to_emails == ["old@test.com"]
+        assert second.to_emails == ["new@test.com", "ap@test.com"]
+
     def test_primary_plus_billing(self):
         """When both primary and billing contacts exist, TO should contain both."""
         contacts = [_make_contact(
@@ -11,12 +11,14 @@ Covers:
 - Error handling (missing file, missing sheet)
 """
 
+import os
 from pathlib import Path
 
 import pytest
 
 from src.data_loader import (
     LoadResult,
+    clear_workbook_cache,
     load_workbook,
     load_contacts_only,
     lookup_contact,
@@ -43,6 +45,12 @@ requires_xlsx = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="module")
+def result(xlsx_load_result: LoadResult) -> LoadResult:
+    """The workbook parsed once per session (see conftest.py)."""
+    return xlsx_load_result
+
+
 # ============================================================================
 # Full Workbook Load
 # ============================================================================
@@ -51,11 +59,6 @@ requires_xlsx = pytest.mark.skipif(
 class TestLoadWorkbook:
     """Test loading the full workbook with actual production data."""
 
-    @pytest.fixture(scope="class")
-    def result(self) -> LoadResult:
-        """Load the workbook once for all tests in this class."""
-        return load_workbook(str(XLSX_PATH))
-
     # --- Invoice counts ---
 
     def test_invoice_count(self, result: LoadResult):
@@ -162,15 +165,11 @@ class TestLoadWorkbook:
 class TestInvoiceFields:
     """Validate specific invoice fields from the loaded data."""
 
-    @pytest.fixture(scope="class")
-    def result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     def _find_invoice(self, result: LoadResult, order_no: str) -> Invoice:
-        for inv in result.invoices:
-            if inv.invoice_number == order_no:
-                return inv
-        pytest.fail(f"Invoice {order_no} not found")
+        inv = result.get_invoice(order_no)
+        if inv is None:
+            pytest.fail(f"Invoice {order_no} not found")
+        return inv
 
     def test_aroma_farms_fields(self, result: LoadResult):
         """Validate Aroma Farms (order 906858, Coming Due)."""
@@ -187,7 +186,7 @@ class TestInvoiceFields:
 
     def test_dazed_new_york_invoices(self, result: LoadResult):
         """Dazed - New York should have 2 invoices."""
-        dazed = [inv for inv in result.invoices if inv.store_name == "Dazed - New York"]
+        dazed = result.invoices_by_store.get("Dazed - New York", [])
         assert len(dazed) == 2
 
     def test_paid_invoice(self, result: LoadResult):
@@ -235,25 +234,25 @@ class TestInvoiceFields:
 class TestTierDistribution:
     """Verify tier distribution matches the data patterns analysis."""
 
-    @pytest.fixture(scope="class")
-    def result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     def test_coming_due_count(self, result: LoadResult):
         """~16 invoices should be Coming Due (days < 0)."""
-        count = sum(1 for inv in result.invoices if inv.tier == Tier.T0)
+        count = result.tier_counts[Tier.T0]
         assert count >= 14 and count <= 18, f"Coming Due: {count}"
 
     def test_overdue_count(self, result: LoadResult):
         """~34 invoices should be Overdue (days 0-29)."""
-        count = sum(1 for inv in result.invoices if inv.tier == Tier.T1)
+        count = result.tier_counts[Tier.T1]
         assert count >= 28 and count <= 40, f"Overdue: {count}"
 
     def test_past_due_30_count(self, result: LoadResult):
         """30+ Days Past Due invoices should exist (count varies with live data)."""
-        count = sum(1 for inv in result.invoices if inv.tier == Tier.T2)
+        count = result.tier_counts[Tier.T2]
         assert count >= 1, f"30+ Past Due: {count}"
 
+    def test_tier_counts_cover_every_invoice(self, result: LoadResult):
+        assert set(result.tier_counts) == set(Tier)
+        assert sum(result.tier_counts.values()) == len(result.invoices)
+
 
 # ============================================================================
 # Skip Reason Distribution
@@ -263,25 +262,13 @@ class TestTierDistribution:
 class TestSkipReasons:
     """Verify skip reason detection matches expected patterns."""
 
-    @pytest.fixture(scope="class")
-    def result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     def test_paid_invoices_skipped(self, result: LoadResult):
-        paid_skipped = [
-            inv for inv in result.invoices
-            if inv.skip_reason == SkipReason.ALREADY_PAID
-        ]
-        assert len(paid_skipped) == 9
+        assert result.skip_counts[SkipReason.ALREADY_PAID] == 9
 
     def test_email_sent_skipped(self, result: LoadResult):
         """Most invoices have email_sent=True (93% per data patterns)."""
-        email_skipped = [
-            inv for inv in result.invoices
-            if inv.skip_reason == SkipReason.EMAIL_ALREADY_SENT
-        ]
         # After paid filter, email_sent catches more
-        assert len(email_skipped) >= 40
+        assert result.skip_counts[SkipReason.EMAIL_ALREADY_SENT] >= 40
 
     def test_actionable_invoices_count(self, result: LoadResult):
         """Actionable (sendable) invoices should be ~5."""
@@ -295,6 +282,7 @@ class TestSkipReasons:
         assert len(actionable) <= 15, (
             f"Expected fewer actionable invoices, got {len(actionable)}"
         )
+        assert all(inv.is_sendable for inv in actionable)
 
 
 # ============================================================================
@@ -305,10 +293,6 @@ class TestSkipReasons:
 class TestContactParsing:
     """Test contact parsing from the Managers sheet."""
 
-    @pytest.fixture(scope="class")
-    def result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     def test_contacts_have_store_name(self, result: LoadResult):
         for contact in result.contacts[:10]:
             assert contact.store_name != ""
@@ -345,10 +329,6 @@ class TestContactParsing:
 class TestContactLookup:
     """Test fuzzy contact lookup against real Managers data."""
 
-    @pytest.fixture(scope="class")
-    def result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     def test_exact_match(self, result: LoadResult):
         """Aroma Farms should match exactly."""
         contact = result.get_contact("Aroma Farms")
@@ -412,6 +392,27 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="not found"):
             load_workbook(str(XLSX_PATH), overdue_sheet="NonExistent Sheet")
 
+    def test_failed_load_closes_workbook(self, tmp_path, monkeypatch):
+        """The workbook handle is released when parsing raises."""
+        import src.data_loader as data_loader
+
+        closed: list[bool] = []
+        real_open = data_loader._open_workbook
+
+        def _spy_open(source):
+            wb = real_open(source)
+            real_close = wb.close
+            wb.close = lambda: (closed.append(True), real_close())
+            return wb
+
+        monkeypatch.setattr(data_loader, "_open_workbook", _spy_open)
+        path = tmp_path / "ar.xlsx"
+        _write_small_workbook(path, "Aroma Farms")
+
+        with pytest.raises(ValueError, match="not found"):
+            load_workbook(path, overdue_sheet="NonExistent Sheet")
+        assert closed == [True]
+
     @requires_xlsx
     def test_explicit_sheet_name(self):
         """Can explicitly specify which overdue sheet to use."""
@@ -420,6 +421,64 @@ class TestErrorHandling:
         assert len(result.invoices) == 70
 
 
+# ============================================================================
+# LoadResult Views
+# ============================================================================
+
+class TestLoadResult:
+    """Derived LoadResult views built from the invoice list."""
+
+    def test_actionable_invoices_track_changes(self):
+        sendable = Invoice(invoice_number="906858", store_name="Aroma Farms",
+                           account_manager="Ben")
+        paid = Invoice(invoice_number="906859", store_name="Aroma Farms",
+                       account_manager="Ben", paid=True)
+        result = LoadResult(invoices=[sendable, paid])
+        assert result.actionable_invoices == [sendable]
+
+        extra = Invoice(invoice_number="906860", store_name="Seaweed RBNY",
+                        account_manager="Ben")
+        result.invoices.append(extra)
+        assert result.actionable_invoices == [sendable, extra]
+
+    def test_store_groupings_track_changes(self):
+        first = Invoice(invoice_number="906858", store_name="Aroma Farms")
+        second = Invoice(invoice_number="906859", store_name="Seaweed RBNY")
+        result = LoadResult(invoices=[first, second])
+        assert result.invoices_by_store == {
+            "Aroma Farms": [first], "Seaweed RBNY": [second],
+        }
+        assert result.multi_invoice_stores == frozenset()
+
+        extra = Invoice(invoice_number="906860", store_name="Aroma Farms")
+        result.invoices.append(extra)
+        assert result.invoices_by_store["Aroma Farms"] == [first, extra]
+        assert result.multi_invoice_stores == frozenset({"Aroma Farms"})
+
+    def test_invoice_lookup_tracks_changes(self):
+        first = Invoice(invoice_number="906858", store_name="Aroma Farms")
+        duplicate = Invoice(invoice_number="906858", store_name="Seaweed RBNY")
+        result = LoadResult(invoices=[first, duplicate])
+        assert result.invoices_by_number == {"906858": first}
+        assert result.get_invoice("906858") is first
+        assert result.get_invoice("906860") is None
+
+        extra = Invoice(invoice_number="906860", store_name="Aroma Farms")
+        result.invoices.append(extra)
+        assert result.invoices_by_number["906860"] is extra
+        assert result.get_invoice("906860") is extra
+
+    def test_resolver_view_carries_license_number(self):
+        invoice = Invoice(invoice_number="906858", store_name="Aroma Farms",
+                          license_number="OCM-RETL-24-000123")
+        result = LoadResult(invoices=[invoice])
+
+        (record,) = result.resolver_view
+        assert record.order_no == 906858
+        assert record.location == "Aroma Farms"
+        assert record.license_number == "OCM-RETL-24-000123"
+
+
 # ============================================================================
 # Data Cleaning
 # ============================================================================
@@ -428,10 +487,6 @@ class TestErrorHandling:
 class TestDataCleaning:
     """Test that data cleaning is applied correctly."""
 
-    @pytest.fixture(scope="class")
-    def result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     def test_no_empty_store_names(self, result: LoadResult):
         """No invoice should have an empty store name."""
         for inv in result.invoices:
@@ -464,3 +519,115 @@ class TestDataCleaning:
         assert len(result.warnings) < 20, (
             f"Too many warnings ({len(result.warnings)}): {result.warnings[:5]}"
         )
+
+
+# ============================================================================
+# Workbook Cache
+# ============================================================================
+
+def _write_small_workbook(path: Path, store_name: str) -> None:
+    """Write a minimal overdue + Managers workbook to *path*."""
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Overdue 2-3"
+    ws.append(["Order No", "Location", "Days Over", "Total Due", "Paid"])
+    ws.append([906858, store_name, 5, 1510.0, False])
+    managers = wb.create_sheet("Managers")
+    managers.append(["Retailer Name (DBA)", "POC Email"])
+    managers.append([store_name, "ap@example.com"])
+    wb.save(path)
+
+
+class TestWorkbookCache:
+    """load_workbook memoizes path sources per file version."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_workbook_cache()
+        yield
+        clear_workbook_cache()
+
+    def test_repeat_load_returns_independent_copy(self, tmp_path):
+        path = tmp_path / "ar.xlsx"
+        _write_small_workbook(path, "Aroma Farms")
+
+        first = load_workbook(str(path))
+        first.invoices[0].store_name = "Mutated"
+        second = load_workbook(str(path))
+
+        assert second is not first
+        assert second.invoices[0].store_name == "Aroma Farms"
+        assert load_contacts_only(str(path))[0].store_name == "Aroma Farms"
+
+    def test_rewritten_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "ar.xlsx"
+        _write_small_workbook(path, "Aroma Farms")
+        assert load_workbook(path).invoices[0].store_name == "Aroma Farms"
+
+        _write_small_workbook(path, "Seaweed RBNY")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert load_workbook(path).invoices[0].store_name == "Seaweed RBNY"
+
+
+# ============================================================================
+# Calamine Backend
+# ============================================================================
+
+def _write_mixed_workbook(path: Path) -> None:
+    """Write an overdue + Managers workbook with blanks, floats and dates."""
+    from datetime import datetime
+
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Overdue 2-3"
+    ws.append([
+        "Order No", "Location", "Account Manager", "Due Date",
+        "Days Over", "Total Due", "Paid", "Status", "Notes",
+    ])
+    ws.append([906858, "Aroma Farms", "Ben", datetime(2026, 2, 1), 5, 1510.0,
+               False, None, "Called twice"])
+    ws.append([906859, "Seaweed RBNY.", None, None, None, 2565.25,
+               True, "Payment Enroute", None])
+    ws.append([None] * 9)
+    ws.append([906860, "DeMarinos", "#N/A", "2026-02-03", 31, "1,000.00",
+               False, None, None])
+    managers = wb.create_sheet("Managers")
+    managers.append(["Retailer Name (DBA)", "POC Name & Title", "POC Email", "POC Phone"])
+    managers.append(["Aroma Farms", "Jane Doe - Owner", "Jane@Aroma.com\nap@aroma.com",
+                     5551234567])
+    managers.append(["Seaweed RBNY", None, "ar@seaweed.com", None])
+    wb.save(path)
+
+
+class TestCalamineBackend:
+    """python-calamine, when installed, parses exactly like openpyxl."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_workbook_cache()
+        yield
+        clear_workbook_cache()
+
+    def test_matches_openpyxl(self, tmp_path, monkeypatch):
+        pytest.importorskip("python_calamine")
+        import src.data_loader as data_loader
+
+        path = tmp_path / "ar.xlsx"
+        _write_mixed_workbook(path)
+        calamine = load_workbook(path)
+
+        clear_workbook_cache()
+        monkeypatch.setattr(data_loader, "_HAS_CALAMINE", False)
+        reference = load_workbook(path)
+
+        assert calamine.invoices == reference.invoices
+        assert calamine.contacts == reference.contacts
+        assert calamine.warnings == reference.warnings
+        assert calamine.total_rows_scanned == reference.total_rows_scanned
+        assert calamine.empty_rows_skipped == reference.empty_rows_skipped
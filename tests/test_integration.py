@@ -11,21 +11,22 @@ These tests require:
 """
 
 import email
+import email.parser
 import email.policy
+import functools
 import re
 from collections import Counter
+from itertools import islice
 from pathlib import Path
-from types import SimpleNamespace
 
 import pytest
 
-from src.data_loader import LoadResult, load_workbook
+from src.data_loader import LoadResult
 from src.models import (
     Contact,
     EmailDraft,
     EmailQueue,
     EmailStatus,
-    Invoice,
     InvoiceStatus,
     SkipReason,
     Tier,
@@ -52,6 +53,18 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 XLSX_PATH = PROJECT_ROOT / "data" / "NY Account Receivables_Overdue.xlsx"
 EMAILS_DIR = PROJECT_ROOT / "data" / "emails"
 
+# Order number(s) in a reference .eml filename: "Invoice 906858",
+# "Invoices 904667 & 905055".
+_EML_INVOICE_RE = re.compile(r"Invoices?\s+(\d+(?:\s*&\s*\d+)*)")
+
+# MIME parts whose decoded text counts as the email body.
+_EML_BODY_TYPES = frozenset({"text/plain", "text/html"})
+
+# A MIME part header marking an attachment, matched in the raw .eml bytes.
+_EML_ATTACHMENT_RE = re.compile(
+    rb"^content-disposition:[ \t]*attachment\b", re.IGNORECASE | re.MULTILINE
+)
+
 XLSX_EXISTS = XLSX_PATH.exists()
 EMAILS_EXIST = EMAILS_DIR.exists() and any(EMAILS_DIR.glob("*.eml"))
 
@@ -66,6 +79,37 @@ requires_emails = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="module")
+def load_result(xlsx_load_result: LoadResult) -> LoadResult:
+    """The workbook parsed once per session (see conftest.py)."""
+    return xlsx_load_result
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_eml(eml_path: Path) -> email.message.EmailMessage:
+    """Parse a .eml file into an EmailMessage object (once per path).
+
+    Callers share the cached message, so treat it as read-only.
+    """
+    with open(eml_path, "rb") as f:
+        return email.message_from_binary_file(f, policy=email.policy.default)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_eml_headers(
+    eml_path: Path,
+    policy: email.policy.Policy = email.policy.default,
+) -> email.message.Message:
+    """Parse only the top-level headers of a .eml file (once per path/policy).
+
+    Pass ``email.policy.compat32`` to get raw header strings when no
+    RFC 2047 decoding or address parsing is needed.  Callers share the
+    cached message, so treat it as read-only.
+    """
+    with open(eml_path, "rb") as f:
+        return email.parser.BytesHeaderParser(policy=policy).parse(f)
+
+
 # ============================================================================
 # Pipeline: XLSX -> Parse -> Classify -> Match
 # ============================================================================
@@ -74,10 +118,6 @@ requires_emails = pytest.mark.skipif(
 class TestFullPipeline:
     """End-to-end test of the full pipeline from XLSX to email queue."""
 
-    @pytest.fixture(scope="class")
-    def load_result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     @pytest.fixture(scope="class")
     def classified_invoices(self, load_result: LoadResult):
         """Convert Invoice objects to dicts and classify them."""
@@ -103,16 +143,8 @@ class TestFullPipeline:
         Contact dataclass now provides ``retailer_name`` property
         that aliases ``store_name``, so no wrapping adapter is needed.
         """
-        mock_invoices = [
-            SimpleNamespace(
-                order_no=int(inv.invoice_number),
-                location=inv.store_name,
-                license_number="",
-            )
-            for inv in load_result.invoices
-        ]
         return resolve_contacts(
-            mock_invoices,
+            load_result.resolver_view,
             load_result.contacts,
             group_by_location=True,
         )
@@ -170,17 +202,15 @@ class TestFullPipeline:
         """
         queue = EmailQueue()
 
-        # Group ALL invoices by location (not just sendable)
-        loc_invoices: dict[str, list[Invoice]] = {}
-        for inv in load_result.invoices:
-            loc_invoices.setdefault(inv.store_name, []).append(inv)
+        # ALL invoices by location (not just sendable)
+        loc_invoices = load_result.invoices_by_store
 
         for match_result in resolution_report.matched:
             location = match_result.invoice_location
             if location not in loc_invoices:
                 continue
 
-            invs = loc_invoices[location]
+            invs = list(loc_invoices[location])  # shared session fixture
             contact = match_result.contact
 
             draft = EmailDraft(
@@ -250,8 +280,7 @@ class TestFullPipeline:
 
     def test_multi_invoice_dispensaries(self, load_result: LoadResult):
         """Multi-invoice dispensaries should be identifiable."""
-        loc_counts = Counter(inv.store_name for inv in load_result.invoices)
-        multi = {loc: cnt for loc, cnt in loc_counts.items() if cnt > 1}
+        multi = load_result.multi_invoice_stores
         assert len(multi) == 10, f"Expected 10 multi-invoice dispensaries, got {len(multi)}"
 
 
@@ -264,10 +293,6 @@ class TestFullPipeline:
 class TestEmailComparison:
     """Compare generated email components against original .eml files."""
 
-    @pytest.fixture(scope="class")
-    def load_result(self) -> LoadResult:
-        return load_workbook(str(XLSX_PATH))
-
     @pytest.fixture(scope="class")
     def eml_files(self) -> dict[str, Path]:
         """Index .eml files by order number extracted from filename."""
@@ -275,15 +300,23 @@ class TestEmailComparison:
         for eml_path in EMAILS_DIR.glob("*.eml"):
             # Extract order numbers from filename like:
             # "PICC - Aroma Farms - Nabis Invoice 906858 - Coming Due.eml"
-            match = re.search(r'Invoice[s]?\s+([\d]+(?:\s*&\s*\d+)*)', eml_path.stem)
+            match = _EML_INVOICE_RE.search(eml_path.stem)
             if match:
                 emls[match.group(1).replace(" ", "")] = eml_path
         return emls
 
-    def _parse_eml(self, eml_path: Path) -> email.message.EmailMessage:
-        """Parse a .eml file into an EmailMessage object."""
-        with open(eml_path, "rb") as f:
-            return email.message_from_binary_file(f, policy=email.policy.default)
+    @pytest.fixture(scope="class")
+    def eml_files_by_invoice(self, eml_files: dict[str, Path]) -> dict[str, Path]:
+        """Index .eml files by each individual order number.
+
+        A multi-invoice key like "904667&905055" maps both numbers to the
+        same file; the first file seen wins.
+        """
+        by_invoice: dict[str, Path] = {}
+        for key, eml_path in eml_files.items():
+            for order_no in key.split("&"):
+                by_invoice.setdefault(order_no, eml_path)
+        return by_invoice
 
     # --- Subject Line Comparison ---
 
@@ -292,26 +325,25 @@ class TestEmailComparison:
         if "906858" not in eml_files:
             pytest.skip("Aroma Farms .eml not found")
 
-        msg = self._parse_eml(eml_files["906858"])
+        msg = _parse_eml_headers(eml_files["906858"])
         actual_subject = msg["Subject"]
         assert "PICC" in actual_subject
         assert "Aroma Farms" in actual_subject
         assert "906858" in actual_subject
         assert "Coming Due" in actual_subject
 
-    def test_subject_line_pattern_seaweed_multi(self, load_result, eml_files):
+    def test_subject_line_pattern_seaweed_multi(self, load_result, eml_files_by_invoice):
         """Verify Seaweed RBNY multi-invoice subject uses '&' separator."""
         # Try to find the multi-invoice Seaweed email
-        seaweed_key = None
-        for key in eml_files:
-            if "904667" in key or "905055" in key:
-                seaweed_key = key
-                break
+        seaweed_path = (
+            eml_files_by_invoice.get("904667")
+            or eml_files_by_invoice.get("905055")
+        )
 
-        if seaweed_key is None:
+        if seaweed_path is None:
             pytest.skip("Seaweed RBNY multi-invoice .eml not found")
 
-        msg = self._parse_eml(eml_files[seaweed_key])
+        msg = _parse_eml_headers(seaweed_path)
         actual_subject = msg["Subject"]
         assert "Seaweed RBNY" in actual_subject
         assert "Invoices" in actual_subject  # plural
@@ -333,7 +365,7 @@ class TestEmailComparison:
         if order_no not in eml_files:
             pytest.skip(f"EML for order {order_no} not found")
 
-        msg = self._parse_eml(eml_files[order_no])
+        msg = _parse_eml_headers(eml_files[order_no])
         actual_subject = msg["Subject"]
         assert expected_tier_label in actual_subject, (
             f"Expected '{expected_tier_label}' in subject: {actual_subject}"
@@ -343,12 +375,7 @@ class TestEmailComparison:
 
     def test_generated_subject_format(self, load_result):
         """Verify our subject builder produces the same format as .eml files."""
-        inv = None
-        for i in load_result.invoices:
-            if i.invoice_number == "906858":
-                inv = i
-                break
-
+        inv = load_result.get_invoice("906858")
         if inv is None:
             pytest.skip("Invoice 906858 not found")
 
@@ -367,8 +394,8 @@ class TestEmailComparison:
     def test_cc_includes_picc_team(self, eml_files):
         """Most .eml files should CC PICC team members."""
         picc_found = 0
-        for order_no, eml_path in list(eml_files.items())[:5]:
-            msg = self._parse_eml(eml_path)
+        for order_no, eml_path in islice(eml_files.items(), 5):
+            msg = _parse_eml_headers(eml_path, email.policy.compat32)
             cc = str(msg.get("Cc", "") or msg.get("CC", "") or "").lower()
             # Check for any PICC team members in CC
             if "piccplatform" in cc or "nabis" in cc:
@@ -382,11 +409,9 @@ class TestEmailComparison:
         """At least some .eml files should have attachments (ACH form or PDF)."""
         emls_with_attachments = 0
         for order_no, eml_path in eml_files.items():
-            msg = self._parse_eml(eml_path)
-            for part in msg.walk():
-                if part.get_content_disposition() == "attachment":
-                    emls_with_attachments += 1
-                    break
+            # Raw scan for an attachment part header; no MIME parsing needed
+            if _EML_ATTACHMENT_RE.search(eml_path.read_bytes()):
+                emls_with_attachments += 1
 
         # At least some emails should have attachments
         # (some .eml exports may not include attachments)
@@ -401,14 +426,14 @@ class TestEmailComparison:
         if "906858" not in eml_files:
             pytest.skip("Aroma Farms .eml not found")
 
-        msg = self._parse_eml(eml_files["906858"])
-        body = ""
+        msg = _parse_eml(eml_files["906858"])
+        chunks: list[str] = []
         for part in msg.walk():
-            ct = part.get_content_type()
-            if ct == "text/plain" or ct == "text/html":
+            if part.get_content_type() in _EML_BODY_TYPES:
                 payload = part.get_payload(decode=True)
                 if payload:
-                    body += payload.decode("utf-8", errors="replace")
+                    chunks.append(payload.decode("utf-8", errors="replace"))
+        body = "".join(chunks)
 
         assert "906858" in body, "Invoice number not found in email body"
         assert "1,510" in body or "1510" in body, "Amount not found in email body"
@@ -456,9 +481,9 @@ class TestCrossModuleConsistency:
         assert model_result.value == "Coming Due", "models.py should treat day 0 as Coming Due"
         assert classifier_result.value == "Coming Due", "tier_classifier should treat day 0 as Coming Due"
 
-    def test_data_loader_invoices_have_valid_tiers(self):
+    def test_data_loader_invoices_have_valid_tiers(self, load_result):
         """Every invoice from data_loader should have a valid tier."""
-        result = load_workbook(str(XLSX_PATH))
+        result = load_result
         for inv in result.invoices:
             assert inv.tier in Tier
             # Cross-check with classifier
@@ -478,9 +503,9 @@ class TestCrossModuleConsistency:
 class TestExportIntegration:
     """Test that the full pipeline output can be serialized."""
 
-    def test_queue_json_export(self, tmp_path):
+    def test_queue_json_export(self, load_result, tmp_path):
         """Build a real queue and export it to JSON."""
-        result = load_workbook(str(XLSX_PATH))
+        result = load_result
         queue = EmailQueue()
 
         for inv in result.actionable_invoices[:5]:
@@ -507,9 +532,9 @@ class TestExportIntegration:
         data = json.loads(output.read_text(encoding="utf-8"))
         assert data["summary"]["total"] == len(queue)
 
-    def test_queue_csv_export(self, tmp_path):
+    def test_queue_csv_export(self, load_result, tmp_path):
         """Build a real queue and export it to CSV."""
-        result = load_workbook(str(XLSX_PATH))
+        result = load_result
         queue = EmailQueue()
 
         for inv in result.actionable_invoices[:3]:
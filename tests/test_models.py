@@ -551,8 +551,7 @@ class TestEmailQueue:
 
     def test_approve_all(self):
         q = EmailQueue()
-        for _ in range(5):
-            q.add(self._make_draft())
+        q.extend(self._make_draft() for _ in range(5))
         count = q.approve_all()
         assert count == 5
         assert len(q.approved) == 5
@@ -560,18 +559,17 @@ class TestEmailQueue:
 
     def test_reject_all(self):
         q = EmailQueue()
-        for _ in range(3):
-            q.add(self._make_draft())
+        q.extend(self._make_draft() for _ in range(3))
         count = q.reject_all("Bad batch")
         assert count == 3
         assert len(q.rejected) == 3
 
     def test_approve_by_tier(self):
         q = EmailQueue()
-        q.add(self._make_draft(tier=Tier.T0))
-        q.add(self._make_draft(tier=Tier.T0))
-        q.add(self._make_draft(tier=Tier.T1))
-        q.add(self._make_draft(tier=Tier.T2))
+        q.extend(
+            self._make_draft(tier=tier)
+            for tier in (Tier.T0, Tier.T0, Tier.T1, Tier.T2)
+        )
 
         count = q.approve_by_tier(Tier.T0)
         assert count == 2
@@ -580,8 +578,7 @@ class TestEmailQueue:
 
     def test_approve_by_index(self):
         q = EmailQueue()
-        for i in range(5):
-            q.add(self._make_draft(store_name=f"Store {i}"))
+        q.extend(self._make_draft(store_name=f"Store {i}") for i in range(5))
         count = q.approve_by_index([0, 2, 4])
         assert count == 3
         assert q.drafts[0].status == EmailStatus.APPROVED
@@ -597,8 +594,7 @@ class TestEmailQueue:
 
     def test_reject_by_index(self):
         q = EmailQueue()
-        for _ in range(3):
-            q.add(self._make_draft())
+        q.extend(self._make_draft() for _ in range(3))
         count = q.reject_by_index([1], "Bad contact")
         assert count == 1
         assert q.drafts[1].status == EmailStatus.REJECTED
@@ -626,31 +622,35 @@ class TestEmailQueue:
         assert "Pending:  1" in summary
         assert "Approved: 1" in summary
 
-    def test_export_json(self, tmp_path):
+    def test_export_json(self):
         q = EmailQueue()
         q.add(self._make_draft())
         q.add(self._make_draft())
 
-        output_path = tmp_path / "queue.json"
-        result_path = q.export_json(output_path)
-        assert result_path.exists()
-
-        data = json.loads(result_path.read_text(encoding="utf-8"))
+        data = json.loads(q.to_json())
         assert data["summary"]["total"] == 2
         assert len(data["drafts"]) == 2
 
-    def test_export_csv(self, tmp_path):
+    def test_export_csv(self):
         q = EmailQueue()
         q.add(self._make_draft())
 
-        output_path = tmp_path / "queue.csv"
-        result_path = q.export_csv(output_path)
-        assert result_path.exists()
-
-        content = result_path.read_text(encoding="utf-8")
+        content = q.to_csv()
         assert "store_name" in content
         assert "Test Store" in content
 
+    def test_export_files(self, tmp_path):
+        """export_json / export_csv write the same content to disk."""
+        q = EmailQueue()
+        q.add(self._make_draft())
+
+        json_path = q.export_json(tmp_path / "out" / "queue.json")
+        assert json_path.exists()
+        assert json.loads(json_path.read_text(encoding="utf-8"))["summary"]["total"] == 1
+
+        csv_path = q.export_csv(tmp_path / "out" / "queue.csv")
+        assert csv_path.read_bytes() == q.to_csv().encode("utf-8")
+
     def test_queue_sent_and_failed(self):
         q = EmailQueue()
         d1 = self._make_draft()
@@ -12,6 +12,7 @@ Covers:
 """
 
 import math
+from operator import attrgetter
 from typing import Any
 
 import pytest
@@ -93,21 +94,21 @@ class TestClassifySingle:
         (-100, Tier.COMING_DUE),
         (-5, Tier.COMING_DUE),
         (-1, Tier.COMING_DUE),
-        (0, Tier.COMING_DUE),
+        (0, Tier.COMING_DUE),   # boundary: day 0 -> day 1
 
         # Overdue: 1-29
         (1, Tier.OVERDUE),
         (2, Tier.OVERDUE),
         (15, Tier.OVERDUE),
-        (29, Tier.OVERDUE),
+        (29, Tier.OVERDUE),   # boundary: day 29 -> day 30
 
         # Past Due 30+: >= 30 (all consolidated into one tier)
         (30, Tier.PAST_DUE),
         (35, Tier.PAST_DUE),
-        (39, Tier.PAST_DUE),
+        (39, Tier.PAST_DUE),   # 39 and 40 share a tier (no 40 boundary)
         (40, Tier.PAST_DUE),   # was PAST_DUE_40, now consolidated
         (45, Tier.PAST_DUE),
-        (49, Tier.PAST_DUE),
+        (49, Tier.PAST_DUE),   # 49 and 50 share a tier (no 50 boundary)
         (50, Tier.PAST_DUE),   # was PAST_DUE_50, now consolidated
         (52, Tier.PAST_DUE),
         (75, Tier.PAST_DUE),
@@ -119,48 +120,20 @@ class TestClassifySingle:
         assert result.tier == expected_tier
         assert result.days_past_due == days
 
-    # --- Boundary transitions (N-1 -> N) ---
-
-    def test_boundary_overdue_transition(self):
-        """Day 0 is COMING_DUE, day 1 is OVERDUE."""
-        assert classify(0).tier == Tier.COMING_DUE
-        assert classify(1).tier == Tier.OVERDUE
-
-    def test_boundary_past_due_30_transition(self):
-        """Day 29 is OVERDUE, day 30 is PAST_DUE."""
-        assert classify(29).tier == Tier.OVERDUE
-        assert classify(30).tier == Tier.PAST_DUE
-
-    def test_no_40_boundary(self):
-        """Day 39 and day 40 are both PAST_DUE (no boundary at 40 anymore)."""
-        assert classify(39).tier == Tier.PAST_DUE
-        assert classify(40).tier == Tier.PAST_DUE
-
-    def test_no_50_boundary(self):
-        """Day 49 and day 50 are both PAST_DUE (no boundary at 50 anymore)."""
-        assert classify(49).tier == Tier.PAST_DUE
-        assert classify(50).tier == Tier.PAST_DUE
-
     # --- Edge cases ---
 
-    def test_zero_days(self):
-        result = classify(0)
-        assert result.tier == Tier.COMING_DUE
-        assert result.days_past_due == 0
+    @pytest.mark.parametrize("days,expected_tier,expected_ocm,expected_past", [
+        pytest.param(0, Tier.COMING_DUE, None, False, id="zero"),
+        pytest.param(-5, Tier.COMING_DUE, None, False, id="negative"),
+        pytest.param(999, Tier.PAST_DUE, 0, True, id="very-large"),
+    ])
+    def test_edge_case_days(self, days, expected_tier, expected_ocm, expected_past):
+        result = classify(days)
+        assert result.tier == expected_tier
+        assert result.days_past_due == days
         assert result.input_was_null is False
-
-    def test_negative_days(self):
-        result = classify(-5)
-        assert result.tier == Tier.COMING_DUE
-        assert result.days_past_due == -5
-        assert result.days_until_ocm is None
-        assert result.is_past_ocm_deadline is False
-
-    def test_very_large_days(self):
-        result = classify(999)
-        assert result.tier == Tier.PAST_DUE
-        assert result.is_past_ocm_deadline is True
-        assert result.days_until_ocm == 0
+        assert result.days_until_ocm == expected_ocm
+        assert result.is_past_ocm_deadline is expected_past
 
     def test_none_input(self):
         result = classify(None)
@@ -241,48 +214,55 @@ class TestOCMDeadline:
 # Tier Metadata
 # ============================================================================
 
+# Expected TIER_METADATA values; dotted keys reach into cc_rules.
+EXPECTED_TIER_METADATA: dict[Tier, dict[str, Any]] = {
+    Tier.COMING_DUE: {
+        "template_name": "coming_due",
+        "urgency_level": UrgencyLevel.LOW,
+        "subject_label": "Coming Due",
+        "includes_ocm_warning": False,
+        "cc_rules.include_nabis_am": False,
+        "cc_rules.include_additional_retailer_contacts": False,
+    },
+    Tier.OVERDUE: {
+        "template_name": "overdue",
+        "urgency_level": UrgencyLevel.MODERATE,
+        "subject_label": "Overdue",
+        "includes_ocm_warning": False,
+    },
+    Tier.PAST_DUE: {
+        "template_name": "past_due_30",
+        "urgency_level": UrgencyLevel.HIGH,
+        "subject_label": "30+ Days Past Due",
+        "includes_ocm_warning": True,
+        "cc_rules.include_nabis_am": True,
+    },
+}
+
+
 class TestTierMetadata:
     """Test the TIER_METADATA dictionary for completeness (3-tier system)."""
 
-    def test_all_tiers_have_metadata(self):
-        for tier in Tier:
-            assert tier in TIER_METADATA
-
     def test_metadata_count(self):
         assert len(TIER_METADATA) == 3
 
-    def test_metadata_template_names(self):
-        assert TIER_METADATA[Tier.COMING_DUE].template_name == "coming_due"
-        assert TIER_METADATA[Tier.OVERDUE].template_name == "overdue"
-        assert TIER_METADATA[Tier.PAST_DUE].template_name == "past_due_30"
-
-    def test_metadata_urgency_levels(self):
-        assert TIER_METADATA[Tier.COMING_DUE].urgency_level == UrgencyLevel.LOW
-        assert TIER_METADATA[Tier.OVERDUE].urgency_level == UrgencyLevel.MODERATE
-        assert TIER_METADATA[Tier.PAST_DUE].urgency_level == UrgencyLevel.HIGH
-
-    def test_metadata_subject_labels(self):
-        assert TIER_METADATA[Tier.COMING_DUE].subject_label == "Coming Due"
-        assert TIER_METADATA[Tier.OVERDUE].subject_label == "Overdue"
-        assert TIER_METADATA[Tier.PAST_DUE].subject_label == "30+ Days Past Due"
-
-    def test_ocm_warning_tiers(self):
-        assert TIER_METADATA[Tier.COMING_DUE].includes_ocm_warning is False
-        assert TIER_METADATA[Tier.OVERDUE].includes_ocm_warning is False
-        assert TIER_METADATA[Tier.PAST_DUE].includes_ocm_warning is True
-
-    def test_cc_rules_type(self):
+    def test_all_tiers_have_metadata(self):
         for tier in Tier:
+            assert tier in TIER_METADATA
             assert isinstance(TIER_METADATA[tier].cc_rules, CCRules)
 
-    def test_past_due_includes_nabis_am(self):
-        cc = TIER_METADATA[Tier.PAST_DUE].cc_rules
-        assert cc.include_nabis_am is True
-
-    def test_coming_due_no_additional_contacts(self):
-        cc = TIER_METADATA[Tier.COMING_DUE].cc_rules
-        assert cc.include_additional_retailer_contacts is False
-        assert cc.include_nabis_am is False
+    @pytest.mark.parametrize(
+        "tier,field,expected",
+        [
+            pytest.param(tier, field, expected, id=f"{tier.name}-{field}")
+            for tier, fields in EXPECTED_TIER_METADATA.items()
+            for field, expected in fields.items()
+        ],
+    )
+    def test_metadata_field(self, tier, field, expected):
+        actual = attrgetter(field)(TIER_METADATA[tier])
+        assert actual == expected
+        assert type(actual) is type(expected)
 
 
 # ============================================================================
@@ -326,26 +306,30 @@ class TestDynamicSubjectLabel:
 # Batch Classification
 # ============================================================================
 
+# Invoice dict shape consumed by classify_batch / summarize_batch.
+_INVOICE_TEMPLATE: dict[str, Any] = {
+    "order_no": "906858",
+    "location": "Aroma Farms",
+    "days_past_due": -2,
+    "total_due": 1510.00,
+    "paid": False,
+    "status": None,
+}
+
+
+def _invoice_dict(**overrides: Any) -> dict[str, Any]:
+    """A fresh invoice dict: _INVOICE_TEMPLATE with ``overrides`` applied."""
+    return {**_INVOICE_TEMPLATE, **overrides}
+
+
 class TestClassifyBatch:
     """Test classify_batch for processing multiple invoices at once."""
 
-    def _make_invoice_dict(self, **overrides) -> dict[str, Any]:
-        defaults: dict[str, Any] = {
-            "order_no": "906858",
-            "location": "Aroma Farms",
-            "days_past_due": -2,
-            "total_due": 1510.00,
-            "paid": False,
-            "status": None,
-        }
-        defaults.update(overrides)
-        return defaults
-
     def test_basic_classification(self):
         invoices = [
-            self._make_invoice_dict(days_past_due=-2),
-            self._make_invoice_dict(order_no="903480", days_past_due=27),
-            self._make_invoice_dict(order_no="902925", days_past_due=31),
+            _invoice_dict(days_past_due=-2),
+            _invoice_dict(order_no="903480", days_past_due=27),
+            _invoice_dict(order_no="902925", days_past_due=31),
         ]
         results = classify_batch(invoices)
         assert len(results) == 3
@@ -355,7 +339,7 @@ class TestClassifyBatch:
 
     def test_skip_paid(self):
         invoices = [
-            self._make_invoice_dict(paid=True),
+            _invoice_dict(paid=True),
         ]
         results = classify_batch(invoices)
         assert results[0]["_skipped"] is True
@@ -363,7 +347,7 @@ class TestClassifyBatch:
 
     def test_skip_payment_enroute(self):
         invoices = [
-            self._make_invoice_dict(status="Payment Enroute"),
+            _invoice_dict(status="Payment Enroute"),
         ]
         results = classify_batch(invoices)
         assert results[0]["_skipped"] is True
@@ -371,14 +355,14 @@ class TestClassifyBatch:
 
     def test_skip_payment_enroute_case_insensitive(self):
         invoices = [
-            self._make_invoice_dict(status="  payment enroute  "),
+            _invoice_dict(status="  payment enroute  "),
         ]
         results = classify_batch(invoices)
         assert results[0]["_skipped"] is True
 
     def test_no_skip_when_not_paid(self):
         invoices = [
-            self._make_invoice_dict(paid=False, status=None),
+            _invoice_dict(paid=False, status=None),
         ]
         results = classify_batch(invoices)
         assert results[0]["_skipped"] is False
@@ -387,15 +371,15 @@ class TestClassifyBatch:
     def test_skip_disabled(self):
         """When skip flags are disabled, paid/enroute invoices are not skipped."""
         invoices = [
-            self._make_invoice_dict(paid=True),
-            self._make_invoice_dict(status="Payment Enroute"),
+            _invoice_dict(paid=True),
+            _invoice_dict(status="Payment Enroute"),
         ]
         results = classify_batch(invoices, skip_paid=False, skip_payment_enroute=False)
         assert results[0]["_skipped"] is False
         assert results[1]["_skipped"] is False
 
     def test_batch_augments_in_place(self):
-        invoices = [self._make_invoice_dict()]
+        invoices = [_invoice_dict()]
         results = classify_batch(invoices)
         # Results should be the same list objects
         assert results is invoices
@@ -404,7 +388,7 @@ class TestClassifyBatch:
         assert "template_name" in invoices[0]
 
     def test_batch_adds_all_fields(self):
-        invoices = [self._make_invoice_dict(days_past_due=35)]
+        invoices = [_invoice_dict(days_past_due=35)]
         classify_batch(invoices)
         inv = invoices[0]
         assert "tier" in inv
@@ -436,15 +420,15 @@ class TestClassifyBatch:
     def test_batch_paid_string_variations(self):
         """Test that paid field handles various truthy string formats."""
         for paid_value in [True, "true", "True", "TRUE", "yes", "1", "paid"]:
-            invoices = [self._make_invoice_dict(paid=paid_value)]
+            invoices = [_invoice_dict(paid=paid_value)]
             results = classify_batch(invoices)
             assert results[0]["_skipped"] is True, f"Failed for paid={paid_value}"
 
     def test_batch_mixed_skip_and_classify(self):
         """Skipped invoices still get tier classification for reporting."""
         invoices = [
-            self._make_invoice_dict(order_no="1", days_past_due=15, paid=True),
-            self._make_invoice_dict(order_no="2", days_past_due=35, paid=False),
+            _invoice_dict(order_no="1", days_past_due=15, paid=True),
+            _invoice_dict(order_no="2", days_past_due=35, paid=False),
         ]
         results = classify_batch(invoices)
         # Paid invoice is skipped but still classified
@@ -454,6 +438,30 @@ class TestClassifyBatch:
         assert results[1]["_skipped"] is False
         assert results[1]["tier_label"] == "30+ Days Past Due"
 
+    def test_nan_days_share_one_cache_entry(self):
+        from src.tier_classifier import _batch_fields
+
+        _batch_fields.cache_clear()
+        invoices = [_invoice_dict(days_past_due=float("nan")) for _ in range(20)]
+        results = classify_batch(invoices)
+        assert _batch_fields.cache_info().currsize == 1
+        assert all(inv["tier"] == Tier.COMING_DUE for inv in results)
+
+    def test_large_batch_matches_classify(self):
+        """Large batches agree with classify() row by row."""
+        values = [None, float("nan"), 12.7, 2**40, -(2**40)] + list(range(-20, 120))
+        invoices = [
+            _invoice_dict(days_past_due=values[i % len(values)])
+            for i in range(5000)
+        ]
+        results = classify_batch(invoices)
+        for inv, value in zip(results, (values[i % len(values)] for i in range(len(results)))):
+            expected = classify(value)
+            assert inv["tier"] == expected.tier
+            assert inv["days_until_ocm"] == expected.days_until_ocm
+            assert inv["is_past_ocm_deadline"] == expected.is_past_ocm_deadline
+
+
 
 # ============================================================================
 # Batch Summary
@@ -464,10 +472,8 @@ class TestSummarizeBatch:
 
     def test_summary_structure(self):
         invoices = [
-            {"order_no": "1", "days_past_due": -2, "total_due": 1510.00,
-             "paid": False, "status": None},
-            {"order_no": "2", "days_past_due": 15, "total_due": 2565.00,
-             "paid": False, "status": None},
+            _invoice_dict(order_no="1", days_past_due=-2, total_due=1510.00),
+            _invoice_dict(order_no="2", days_past_due=15, total_due=2565.00),
         ]
         classify_batch(invoices)
         summary = summarize_batch(invoices)
@@ -479,9 +485,9 @@ class TestSummarizeBatch:
 
     def test_summary_tier_counts(self):
         invoices = [
-            {"order_no": "1", "days_past_due": -2, "total_due": 1000, "paid": False, "status": None},
-            {"order_no": "2", "days_past_due": -1, "total_due": 1000, "paid": False, "status": None},
-            {"order_no": "3", "days_past_due": 15, "total_due": 2000, "paid": False, "status": None},
+            _invoice_dict(order_no="1", days_past_due=-2, total_due=1000),
+            _invoice_dict(order_no="2", days_past_due=-1, total_due=1000),
+            _invoice_dict(order_no="3", days_past_due=15, total_due=2000),
         ]
         classify_batch(invoices)
         summary = summarize_batch(invoices)
@@ -491,8 +497,8 @@ class TestSummarizeBatch:
 
     def test_summary_with_skipped(self):
         invoices = [
-            {"order_no": "1", "days_past_due": 5, "total_due": 1000, "paid": True, "status": None},
-            {"order_no": "2", "days_past_due": 5, "total_due": 2000, "paid": False, "status": None},
+            _invoice_dict(order_no="1", days_past_due=5, total_due=1000, paid=True),
+            _invoice_dict(order_no="2", days_past_due=5, total_due=2000),
         ]
         classify_batch(invoices)
         summary = summarize_batch(invoices)